@@ -0,0 +1,8 @@
+"""Shared pytest fixtures."""
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def clear_stt_env(monkeypatch: pytest.MonkeyPatch):
+    """Start every test without STT_INPUT_ADDRESS set."""
+    monkeypatch.delenv("STT_INPUT_ADDRESS", raising=False)
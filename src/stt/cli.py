@@ -4,10 +4,8 @@ import click
 from pathlib import Path
 from textwrap import dedent
 
-from .config import STTConfig
-from .service import STTService
+from .config import DEFAULT_INPUT_ADDRESS, DEFAULT_OUTPUT_ADDRESS, STTConfig
 from .utils.logging import setup_logging
-from .dataset.generator import DatasetGenerator
 
 @click.group()
 def cli():
@@ -19,12 +17,54 @@ def cli():
 @click.option(
     "--input-address",
     default=None,
-    help="ZMQ ROUTER input address (overrides STT_INPUT_ADDRESS env var, default: tcp://localhost:20499)",
+    help=f"ZMQ ROUTER input address (overrides STT_INPUT_ADDRESS env var, default: {DEFAULT_INPUT_ADDRESS})",
 )
 @click.option(
     "--output-address",
     default=None,
-    help="ZMQ DEALER output address (overrides LLM_RAG_PIPE_INPUT_ADDRESS env var, default: tcp://localhost:25000)",
+    help=f"ZMQ PUSH output address (overrides LLM_RAG_PIPE_INPUT_ADDRESS env var, default: {DEFAULT_OUTPUT_ADDRESS})",
+)
+@click.option(
+    "--zmq-hwm",
+    default=STTConfig.zmq_hwm,
+    type=click.IntRange(min=0),
+    help="ZMQ send/receive high water mark in messages",
+    show_default=True,
+)
+@click.option(
+    "--zmq-buffer-bytes",
+    default=STTConfig.zmq_buffer_bytes,
+    type=click.IntRange(min=0),
+    help="ZMQ kernel send/receive buffer size in bytes",
+    show_default=True,
+)
+@click.option(
+    "--decode-workers",
+    default=STTConfig.decode_workers,
+    type=click.IntRange(min=1),
+    help="Threads decoding audio while the model transcribes",
+    show_default=True,
+)
+@click.option(
+    "--queue-size",
+    default=STTConfig.pipeline_queue_size,
+    type=click.IntRange(min=1),
+    help="Maximum requests buffered between pipeline stages",
+    show_default=True,
+)
+@click.option(
+    "--max-batch-size",
+    default=STTConfig.max_batch_size,
+    type=click.IntRange(min=1),
+    help="Maximum requests transcribed in one model call",
+    show_default=True,
+)
+@click.option(
+    "--batch-window-ms",
+    default=STTConfig.batch_window_ms,
+    type=click.FloatRange(min=0),
+    help="How long to wait for more requests to fill a batch, in ms",
+    show_default=True,
 )
 @click.option(
     "--timeout",
@@ -33,11 +73,38 @@ def cli():
     help="Model idle timeout in minutes before deallocation (default: 10)",
     show_default=True,
 )
+@click.option(
+    "--dtype",
+    default=STTConfig.model_dtype,
+    type=click.Choice(["float32", "float16", "bfloat16"]),
+    help="Model inference precision on CUDA; CPU always uses float32",
+    show_default=True,
+)
+@click.option(
+    "--cache-size",
+    default=STTConfig.transcription_cache_size,
+    type=click.IntRange(min=0),
+    help="Number of transcriptions cached by audio content, 0 disables",
+    show_default=True,
+)
+@click.option(
+    "--result-cache-db",
+    default=None,
+    type=click.Path(dir_okay=False),
+    help="SQLite file for a persistent transcription cache keyed by audio content (default: disabled)",
+)
+@click.option(
+    "--result-cache-max-entries",
+    default=STTConfig.result_cache_max_entries,
+    type=click.IntRange(min=1),
+    help="Maximum entries in the persistent transcription cache",
+    show_default=True,
+)
 @click.option(
     "--convert-to-mono",
     is_flag=True,
     default=False,
-    help="Enable automatic stereo to mono conversion (default: disabled)",
+    help="Enable automatic stereo/multi-channel to mono conversion (default: disabled)",
 )
 @click.option(
     "--log-file",
@@ -58,16 +125,38 @@ def cli():
 def start(
     input_address: str,
     output_address: str,
+    zmq_hwm: int,
+    zmq_buffer_bytes: int,
+    decode_workers: int,
+    queue_size: int,
+    max_batch_size: int,
+    batch_window_ms: float,
     timeout: int,
+    dtype: str,
+    cache_size: int,
+    result_cache_db: str,
+    result_cache_max_entries: int,
     convert_to_mono: bool,
     log_file: str,
     log_level: str,
 ):
     """Start the STT service."""
+    # Deferred so --help and version skip importing NeMo/torch
+    from .service import STTService
 
     # Create configuration with conditional overrides
     config_kwargs = {
+        "zmq_hwm": zmq_hwm,
+        "zmq_buffer_bytes": zmq_buffer_bytes,
+        "decode_workers": decode_workers,
+        "pipeline_queue_size": queue_size,
+        "max_batch_size": max_batch_size,
+        "batch_window_ms": batch_window_ms,
         "model_timeout_minutes": timeout,
+        "model_dtype": dtype,
+        "transcription_cache_size": cache_size,
+        "result_cache_db": Path(result_cache_db) if result_cache_db else None,
+        "result_cache_max_entries": result_cache_max_entries,
         "convert_to_mono": convert_to_mono,
         "log_file": Path(log_file),
         "log_level": log_level.upper(),
@@ -134,11 +223,35 @@ def version():
     help="Logging level (default: INFO)",
     show_default=True,
 )
+@click.option(
+    "--batch-size",
+    default=16,
+    type=click.IntRange(min=1),
+    help="Number of files transcribed per model call (default: 16)",
+    show_default=True,
+)
+@click.option(
+    "--num-workers",
+    default=0,
+    type=click.IntRange(min=0),
+    help="Dataloader workers decoding audio during inference (default: 0)",
+    show_default=True,
+)
+@click.option(
+    "--prefetch-workers",
+    default=8,
+    type=click.IntRange(min=1),
+    help="Threads reading the next batch of files from disk during inference (default: 8)",
+    show_default=True,
+)
 def generate_soprano_dataset(
     directory: Path,
     voice_actor_identifier: str,
     log_file: str,
     log_level: str,
+    batch_size: int,
+    num_workers: int,
+    prefetch_workers: int,
 ):
     """Generate TTS training dataset from .wav files.
 
@@ -154,6 +267,7 @@ def generate_soprano_dataset(
     - {VOICE_ACTOR_IDENTIFIER}.metadata.txt: Metadata file in format "file_id|transcription"
     - {VOICE_ACTOR_IDENTIFIER}.metadata.db: SQLite database tracking transcription state
     """
+    from .dataset.generator import DatasetGenerator
 
     # Set up logging
     setup_logging(
@@ -168,7 +282,9 @@ def generate_soprano_dataset(
 
     try:
         # Create generator and run
-        generator = DatasetGenerator(directory, voice_actor_identifier)
+        generator = DatasetGenerator(
+            directory, voice_actor_identifier, batch_size, num_workers, prefetch_workers
+        )
         generator.generate()
     except KeyboardInterrupt:
         click.echo("\nDataset generation interrupted by user")
@@ -202,8 +318,17 @@ def _print_stt_service_configuration(config):
         ============================================================
           Input Address:      {config.input_address}
           Output Address:     {config.output_address}
+          ZMQ HWM:            {config.zmq_hwm}
+          ZMQ Buffer Bytes:   {config.zmq_buffer_bytes}
+          Decode Workers:     {config.decode_workers}
+          Queue Size:         {config.pipeline_queue_size}
+          Max Batch Size:     {config.max_batch_size}
+          Batch Window:       {config.batch_window_ms} ms
           Model:              {config.model_name}
           Model Timeout:      {config.model_timeout_minutes} minutes
+          Model Dtype:        {config.model_dtype}
+          Cache Size:         {config.transcription_cache_size}
+          Result Cache DB:    {config.result_cache_db or "disabled"}
           Convert to Mono:    {config.convert_to_mono}
           Log File:           {config.log_file}
           Log Level:          {config.log_level}
@@ -5,6 +5,7 @@ from typing import Optional, Callable
 
 from .messaging.schemas import TranscriptionResponse
 from .messaging.serialization import deserialize_transcription_response
+from .messaging.zmq_handler import configure_socket
 
 
 logger = logging.getLogger(__name__)
@@ -15,32 +16,53 @@ class STTClient:
     
     This is designed for downstream services (like LLM/RAG) to consume
     transcriptions from the STT pipe.
+    
+    All clients in a process share the global zmq.Context instance; its I/O
+    thread count is fixed by whichever client connects first.
     """
     
-    def __init__(self, bind_address: str = "tcp://*:5556"):
+    def __init__(
+        self,
+        bind_address: str = "tcp://*:5556",
+        hwm: int = 10000,
+        buffer_bytes: int = 4 * 1024 * 1024,
+        io_threads: int = 2
+    ):
         """Initialize the STT client.
         
         Args:
-            bind_address: Address to bind ROUTER socket (where STT DEALER connects)
+            bind_address: Address to bind PULL socket (where STT PUSH connects)
+            hwm: Socket high water mark (queued messages)
+            buffer_bytes: Kernel socket buffer size in bytes
+            io_threads: libzmq I/O threads for the shared context
         """
         self.bind_address = bind_address
+        self.hwm = hwm
+        self.buffer_bytes = buffer_bytes
+        self.io_threads = io_threads
         self.context: Optional[zmq.Context] = None
         self.socket: Optional[zmq.Socket] = None
+        self._poller: Optional[zmq.Poller] = None
         self._running = False
         
         logger.info(f"STTClient initialized: bind_address={bind_address}")
     
     def connect(self) -> None:
-        """Connect and set up the ROUTER socket."""
+        """Connect and set up the PULL socket."""
         if self.socket is not None:
             logger.warning("Already connected")
             return
         
-        self.context = zmq.Context()
-        self.socket = self.context.socket(zmq.ROUTER)
+        self.context = zmq.Context.instance(io_threads=self.io_threads)
+        self.socket = self.context.socket(zmq.PULL)
+        configure_socket(self.socket, self.hwm, self.buffer_bytes)
+        self.socket.setsockopt(zmq.LINGER, 0)
         self.socket.bind(self.bind_address)
         
-        logger.info(f"ROUTER socket bound to {self.bind_address}")
+        self._poller = zmq.Poller()
+        self._poller.register(self.socket, zmq.POLLIN)
+        
+        logger.info(f"PULL socket bound to {self.bind_address}")
     
     def receive(self, timeout_ms: int = 1000) -> Optional[TranscriptionResponse]:
         """Receive a single transcription response.
@@ -54,35 +76,40 @@ class STTClient:
         if not self.socket:
             raise RuntimeError("Not connected. Call connect() first.")
         
-        poller = zmq.Poller()
-        poller.register(self.socket, zmq.POLLIN)
-        
-        events = dict(poller.poll(timeout_ms))
-        
-        if self.socket not in events:
+        # The poller only holds this socket, so any event means it is readable
+        if not self._poller.poll(timeout_ms):
             return None
         
-        try:
-            # ROUTER receives: [identity, empty, data]
-            message_parts = self.socket.recv_multipart()
+        return self._receive_message()
+    
+    def _receive_message(self, flags: int = 0) -> Optional[TranscriptionResponse]:
+        """Read and deserialize one message from the socket.
+        
+        Args:
+            flags: ZMQ receive flags (e.g. zmq.NOBLOCK)
             
-            if len(message_parts) < 2:
-                logger.error(f"Invalid message format: {len(message_parts)} parts")
-                return None
+        Returns:
+            TranscriptionResponse, or None if the message was invalid
             
-            # Extract the actual data (last part)
-            response_data = message_parts[-1]
+        Raises:
+            zmq.Again: If flags include zmq.NOBLOCK and no message is queued
+        """
+        try:
+            # PULL receives a single frame without an identity envelope
+            frame = self.socket.recv(flags, copy=False)
             
-            # Deserialize
-            response = deserialize_transcription_response(response_data)
+            # Deserialize straight from the frame buffer without copying
+            response = deserialize_transcription_response(frame.buffer)
             
             logger.debug(
-                f"Received transcription: request_id={response.request_id}, "
-                f"status={response.status}"
+                "Received transcription: request_id=%s, status=%s",
+                response.request_id, response.status
             )
             
             return response
             
+        except zmq.Again:
+            raise
         except ValueError as e:
             logger.error(f"Failed to deserialize response: {e}")
             return None
@@ -109,21 +136,42 @@ class STTClient:
         
         try:
             while self._running:
-                response = self.receive(timeout_ms=timeout_ms)
+                if not self._poller.poll(timeout_ms):
+                    continue
                 
-                if response is not None:
+                # Drain everything already queued before polling again
+                while self._running:
                     try:
-                        callback(response)
-                    except Exception as e:
-                        logger.error(
-                            f"Callback error for request {response.request_id}: {e}",
-                            exc_info=True
-                        )
+                        response = self._receive_message(zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+                    
+                    if response is not None:
+                        self._invoke_callback(callback, response)
         except KeyboardInterrupt:
             logger.info("Listening interrupted by user")
         finally:
             self._running = False
     
+    @staticmethod
+    def _invoke_callback(
+        callback: Callable[[TranscriptionResponse], None],
+        response: TranscriptionResponse
+    ) -> None:
+        """Invoke the listener callback, logging any error it raises.
+        
+        Args:
+            callback: Function to call with the response
+            response: The received TranscriptionResponse
+        """
+        try:
+            callback(response)
+        except Exception as e:
+            logger.error(
+                f"Callback error for request {response.request_id}: {e}",
+                exc_info=True
+            )
+    
     def stop(self) -> None:
         """Stop listening loop."""
         self._running = False
@@ -135,15 +183,17 @@ class STTClient:
         
         self._running = False
         
+        if self._poller and self.socket:
+            self._poller.unregister(self.socket)
+        self._poller = None
+        
         if self.socket:
             self.socket.close()
             self.socket = None
             logger.debug("Socket closed")
         
-        if self.context:
-            self.context.term()
-            self.context = None
-            logger.debug("Context terminated")
+        # The context is shared process-wide, so it is released but not terminated
+        self.context = None
     
     def __enter__(self):
         """Context manager entry."""
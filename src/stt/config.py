@@ -2,7 +2,11 @@
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Optional
+
+
+DEFAULT_INPUT_ADDRESS = "tcp://localhost:20499"
+DEFAULT_OUTPUT_ADDRESS = "tcp://localhost:25000"
 
 
 @dataclass
@@ -10,12 +14,24 @@ class STTConfig:
     """Main configuration for the STT service."""
     
     # ZMQ addresses
-    input_address: str = field(default_factory=lambda: os.getenv("STT_INPUT_ADDRESS", "tcp://localhost:20499"))
-    output_address: str = field(default_factory=lambda: os.getenv("LLM_RAG_PIPE_INPUT_ADDRESS", "tcp://localhost:25000"))
+    input_address: str = field(default_factory=lambda: os.getenv("STT_INPUT_ADDRESS", DEFAULT_INPUT_ADDRESS))
+    output_address: str = field(default_factory=lambda: os.getenv("LLM_RAG_PIPE_INPUT_ADDRESS", DEFAULT_OUTPUT_ADDRESS))
+    zmq_hwm: int = 10000
+    zmq_buffer_bytes: int = 4 * 1024 * 1024  # 4 MB
+    
+    # Request pipeline
+    decode_workers: int = 2
+    pipeline_queue_size: int = 4
+    max_batch_size: int = 8
+    batch_window_ms: float = 10.0
     
     # Model configuration
     model_name: str = "nvidia/parakeet-tdt-0.6b-v2"
     model_timeout_minutes: int = 10
+    model_dtype: Literal["float32", "float16", "bfloat16"] = "float16"
+    transcription_cache_size: int = 1024
+    result_cache_db: Optional[Path] = None
+    result_cache_max_entries: int = 100_000
     
     # Audio processing
     convert_to_mono: bool = False
@@ -31,3 +47,5 @@ class STTConfig:
         """Convert string paths to Path objects."""
         if isinstance(self.log_file, str):
             self.log_file = Path(self.log_file)
+        if isinstance(self.result_cache_db, str):
+            self.result_cache_db = Path(self.result_cache_db)
@@ -1,31 +1,98 @@
 """SQLite connection utilities with context manager support."""
+import contextlib
 import sqlite3
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 
 class SQLiteConnection:
-    """SQLite database connection with context manager support."""
+    """SQLite database connection with context manager support.
     
-    def __init__(self, db_path: Path):
+    Connections use synchronous=NORMAL, which together with WAL journaling
+    (see enable_wal) makes a commit one WAL append instead of a full fsync
+    of the database file.
+    """
+    
+    PRAGMAS = (
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA cache_size=-65536",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",
+    )
+    
+    def __init__(
+        self,
+        db_path: Path,
+        persistent: bool = False,
+        cached_statements: int = 256,
+        check_same_thread: bool = True
+    ):
         """Initialize SQLite connection.
         
         Args:
             db_path: Path to the SQLite database file
+            persistent: Keep the connection open across ``with`` blocks, so
+                each block is only a transaction; call close() when done
+            cached_statements: Size of the prepared statement cache
+            check_same_thread: Reject use from threads other than the one
+                that opened the connection (disable only with external locking)
         """
         self.db_path = db_path
+        self.persistent = persistent
+        self.cached_statements = cached_statements
+        self.check_same_thread = check_same_thread
         self.connection: Optional[sqlite3.Connection] = None
         self.cursor: Optional[sqlite3.Cursor] = None
     
-    def __enter__(self):
-        """Enter context manager - establish connection."""
-        self.connection = sqlite3.connect(str(self.db_path))
+    def open(self) -> None:
+        """Establish the connection if it is not already open."""
+        if self.connection is not None:
+            return
+        
+        self.connection = sqlite3.connect(
+            str(self.db_path),
+            cached_statements=self.cached_statements,
+            check_same_thread=self.check_same_thread
+        )
         self.connection.row_factory = sqlite3.Row  # Enable dict-like row access
         self.cursor = self.connection.cursor()
+        for pragma in self.PRAGMAS:
+            self.cursor.execute(pragma)
+    
+    def enable_wal(self) -> None:
+        """Switch the database to WAL journaling.
+        
+        The journal mode is stored in the database file, so this only needs
+        to run once when the database is created or opened for writing.
+        """
+        if not self.cursor:
+            raise RuntimeError("Connection not established. Use with statement.")
+        
+        self.cursor.execute("PRAGMA journal_mode=WAL")
+    
+    def close(self) -> None:
+        """Close the connection.
+        
+        Persistent connections run PRAGMA optimize first, as SQLite
+        recommends for long-lived connections, so the query planner
+        statistics reflect what the connection wrote.
+        """
+        if self.connection:
+            if self.persistent:
+                with contextlib.suppress(sqlite3.Error):
+                    self.connection.execute("PRAGMA optimize")
+            self.connection.close()
+        
+        self.connection = None
+        self.cursor = None
+    
+    def __enter__(self):
+        """Enter context manager - establish connection if needed."""
+        self.open()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Exit context manager - close connection."""
+        """Exit context manager - end the transaction, closing unless persistent."""
         if self.connection:
             if exc_type is None:
                 # No exception occurred, commit changes
@@ -34,7 +101,8 @@ class SQLiteConnection:
                 # Exception occurred, rollback changes
                 self.connection.rollback()
             
-            self.connection.close()
+            if not self.persistent:
+                self.close()
         
         return False  # Don't suppress exceptions
     
@@ -53,12 +121,12 @@ class SQLiteConnection:
         
         return self.cursor.execute(query, params)
     
-    def executemany(self, query: str, params_list: list):
+    def executemany(self, query: str, params_list: Iterable):
         """Execute a SQL query with multiple parameter sets.
         
         Args:
             query: SQL query to execute
-            params_list: List of parameter tuples
+            params_list: Iterable of parameter tuples, consumed lazily
             
         Returns:
             Cursor object
@@ -0,0 +1,141 @@
+"""Persistent transcription result cache keyed by audio content hash."""
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from ..connection.sqlite_connection import SQLiteConnection
+
+
+logger = logging.getLogger(__name__)
+
+
+class CacheManager:
+    """SQLite-backed LRU cache of transcriptions, bounded by row count."""
+    
+    def __init__(self, db_path: Path, max_entries: int = 100_000):
+        """Initialize the cache manager.
+        
+        Args:
+            db_path: Path to the SQLite cache database
+            max_entries: Maximum number of cached transcriptions
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        
+        self.db = SQLiteConnection(db_path, persistent=True, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._entry_count = 0
+        
+        logger.info(f"CacheManager initialized: db={db_path}, max_entries={max_entries}")
+    
+    def open(self) -> None:
+        """Open the cache database, creating the table if needed."""
+        with self._lock, self.db as conn:
+            conn.enable_wal()
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS transcription_cache (
+                    audio_hash BLOB PRIMARY KEY,
+                    text TEXT NOT NULL,
+                    confidence REAL,
+                    last_used REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_transcription_cache_last_used
+                ON transcription_cache (last_used)
+            """)
+            conn.execute("SELECT COUNT(*) FROM transcription_cache")
+            self._entry_count = conn.fetchone()[0]
+        
+        logger.info(f"Transcription cache opened with {self._entry_count} entries")
+    
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self.db.close()
+    
+    def get(self, key: bytes) -> Optional[tuple[str, Optional[float]]]:
+        """Look up a cached transcription and mark it as recently used.
+        
+        Args:
+            key: Audio content hash
+            
+        Returns:
+            Tuple of (transcription_text, confidence), or None on a miss
+        """
+        try:
+            with self._lock, self.db as conn:
+                conn.execute(
+                    "SELECT text, confidence FROM transcription_cache WHERE audio_hash = ?",
+                    (key,)
+                )
+                row = conn.fetchone()
+                if row is None:
+                    return None
+                
+                conn.execute(
+                    "UPDATE transcription_cache SET last_used = ? WHERE audio_hash = ?",
+                    (time.time(), key)
+                )
+                return row['text'], row['confidence']
+        
+        except sqlite3.Error as e:
+            logger.warning(f"Transcription cache lookup failed: {e}")
+            return None
+    
+    def put(self, key: bytes, text: str, confidence: Optional[float]) -> None:
+        """Store a transcription, evicting least recently used entries if full.
+        
+        Args:
+            key: Audio content hash
+            text: Transcription text
+            confidence: Transcription confidence, if available
+        """
+        try:
+            with self._lock, self.db as conn:
+                now = time.time()
+                inserted = conn.execute(
+                    "INSERT OR IGNORE INTO transcription_cache (audio_hash, text, confidence, last_used) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, text, confidence, now)
+                ).rowcount
+                
+                if not inserted:
+                    conn.execute(
+                        "UPDATE transcription_cache SET text = ?, confidence = ?, last_used = ? "
+                        "WHERE audio_hash = ?",
+                        (text, confidence, now, key)
+                    )
+                    return
+                
+                self._entry_count += 1
+                if self._entry_count > self.max_entries:
+                    self._evict(conn)
+        
+        except sqlite3.Error as e:
+            logger.warning(f"Transcription cache store failed: {e}")
+    
+    def _evict(self, conn: SQLiteConnection) -> None:
+        """Delete the least recently used entries down to 90% of capacity.
+        
+        Evicting with headroom keeps the delete off the per-insert path.
+        
+        Args:
+            conn: Open connection inside the current transaction
+        """
+        target = int(self.max_entries * 0.9)
+        conn.execute("SELECT COUNT(*) FROM transcription_cache")
+        excess = conn.fetchone()[0] - target
+        
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM transcription_cache WHERE audio_hash IN ("
+                "SELECT audio_hash FROM transcription_cache ORDER BY last_used LIMIT ?)",
+                (excess,)
+            )
+            logger.info(f"Evicted {excess} least recently used cache entries")
+        
+        self._entry_count = target if excess > 0 else target + excess
@@ -1,10 +1,13 @@
 """Model manager with lazy loading and timeout-based deallocation."""
+import contextlib
 import logging
 import threading
 import time
-from typing import Optional
+from typing import Iterator, Optional
 
 import nemo.collections.asr as nemo_asr
+import numpy as np
+import torch
 
 
 logger = logging.getLogger(__name__)
@@ -13,45 +16,60 @@ logger = logging.getLogger(__name__)
 class ModelManager:
     """Manages the ASR model lifecycle with lazy loading and timeout."""
     
-    def __init__(self, model_name: str, timeout_minutes: int = 10):
+    def __init__(
+        self,
+        model_name: str,
+        timeout_minutes: int = 10,
+        dtype: str = "float16"
+    ):
         """Initialize the model manager.
         
         Args:
             model_name: Name of the NeMo ASR model to load
             timeout_minutes: Minutes of inactivity before model deallocation
+            dtype: Inference precision on CUDA ('float32', 'float16' or 'bfloat16').
+                CPU inference always runs in float32.
         """
         self.model_name = model_name
         self.timeout_seconds = timeout_minutes * 60
+        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        self.dtype = getattr(torch, dtype) if self.device.type == "cuda" else torch.float32
         
         self._model: Optional[nemo_asr.models.ASRModel] = None
         self._last_used_time: float = 0
         self._lock = threading.RLock()
-        self._monitor_thread: Optional[threading.Thread] = None
+        self._timeout_timer: Optional[threading.Timer] = None
         self._running = False
         
         logger.info(
             f"ModelManager initialized: model={model_name}, "
-            f"timeout={timeout_minutes} minutes"
+            f"timeout={timeout_minutes} minutes, device={self.device}, dtype={self.dtype}"
         )
     
     def start_monitoring(self) -> None:
-        """Start the background thread that monitors model timeout."""
-        if self._running:
-            return
+        """Start tracking model inactivity for timeout-based deallocation.
+        
+        A single timer is armed while the model is loaded; it fires once the
+        model could have been idle for the full timeout and re-arms itself
+        for the remaining time if the model was used in the meantime.
+        """
+        with self._lock:
+            if self._running:
+                return
+            
+            self._running = True
+            if self._model is not None:
+                self._schedule_timeout_check(self.timeout_seconds)
         
-        self._running = True
-        self._monitor_thread = threading.Thread(
-            target=self._monitor_timeout,
-            daemon=True
-        )
-        self._monitor_thread.start()
         logger.info("Model timeout monitoring started")
     
     def stop_monitoring(self) -> None:
-        """Stop the background monitoring thread."""
-        self._running = False
-        if self._monitor_thread:
-            self._monitor_thread.join(timeout=2.0)
+        """Stop timeout tracking and cancel any pending timer."""
+        with self._lock:
+            self._running = False
+            if self._timeout_timer is not None:
+                self._timeout_timer.cancel()
+                self._timeout_timer = None
         logger.info("Model timeout monitoring stopped")
     
     def get_model(self) -> nemo_asr.models.ASRModel:
@@ -63,31 +81,83 @@ class ModelManager:
         Raises:
             RuntimeError: If model loading fails
         """
+        model = self._model
+        if model is not None:
+            self._last_used_time = time.monotonic()
+            return model
+        
         with self._lock:
             if self._model is None:
                 self._load_model()
             
-            # Update last used time
-            self._last_used_time = time.time()
+            self._last_used_time = time.monotonic()
             return self._model
     
+    def warmup(self, sample_rate: int = 16000) -> None:
+        """Load the model and run a dummy transcription.
+        
+        Moves model loading and first-inference kernel selection out of the
+        first request's latency.
+        
+        Args:
+            sample_rate: Sample rate of the one-second silent warmup clip
+            
+        Raises:
+            RuntimeError: If model loading fails
+        """
+        model = self.get_model()
+        
+        logger.info("Warming up model")
+        start_time = time.monotonic()
+        
+        try:
+            with self.inference_context():
+                model.transcribe([np.zeros(sample_rate, dtype=np.float32)], batch_size=1)
+            logger.info(f"Model warmup complete in {time.monotonic() - start_time:.2f} seconds")
+        except Exception as e:
+            logger.warning(f"Model warmup transcription failed: {e}")
+    
     def _load_model(self) -> None:
         """Load the ASR model."""
         logger.info(f"Loading model: {self.model_name}")
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
-            self._model = nemo_asr.models.ASRModel.from_pretrained(
+            model = nemo_asr.models.ASRModel.from_pretrained(
                 model_name=self.model_name
             )
-            load_time = time.time() - start_time
+            model = model.to(self.device).eval()
+            
+            # The encoder dominates inference cost; the preprocessor stays in
+            # float32 so feature extraction is unaffected by reduced precision.
+            if self.dtype != torch.float32:
+                model.encoder = model.encoder.to(dtype=self.dtype)
+            
+            self._model = model
+            load_time = time.monotonic() - start_time
             logger.info(f"Model loaded successfully in {load_time:.2f} seconds")
-            self._last_used_time = time.time()
+            self._last_used_time = time.monotonic()
+            
+            if self._running:
+                self._schedule_timeout_check(self.timeout_seconds)
             
         except Exception as e:
             logger.error(f"Failed to load model {self.model_name}: {e}", exc_info=True)
             raise RuntimeError(f"Model loading failed: {e}") from e
     
+    @contextlib.contextmanager
+    def inference_context(self) -> Iterator[None]:
+        """Context for running inference with the configured device and precision.
+        
+        Disables autograd tracking and, on CUDA with a reduced-precision dtype,
+        enables autocast so mixed-precision kernels are used.
+        """
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(torch.inference_mode())
+            if self.device.type == "cuda" and self.dtype != torch.float32:
+                stack.enter_context(torch.autocast("cuda", dtype=self.dtype))
+            yield
+    
     def _deallocate_model(self) -> None:
         """Deallocate the model to free memory."""
         with self._lock:
@@ -99,37 +169,45 @@ class ModelManager:
                 import gc
                 gc.collect()
                 
-                # If CUDA is available, clear cache
-                try:
-                    import torch
-                    if torch.cuda.is_available():
-                        torch.cuda.empty_cache()
-                        logger.debug("CUDA cache cleared")
-                except ImportError:
-                    pass
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
+                    logger.debug("CUDA cache cleared")
                 
                 logger.info("Model deallocated successfully")
     
-    def _monitor_timeout(self) -> None:
-        """Background thread that monitors inactivity and deallocates model."""
-        check_interval = 60  # Check every minute
+    def _schedule_timeout_check(self, delay_seconds: float) -> None:
+        """Arm the inactivity timer, replacing any pending one.
         
-        while self._running:
-            time.sleep(check_interval)
+        Args:
+            delay_seconds: Seconds until the idle check runs
+        """
+        with self._lock:
+            if self._timeout_timer is not None:
+                self._timeout_timer.cancel()
+            
+            self._timeout_timer = threading.Timer(delay_seconds, self._check_timeout)
+            self._timeout_timer.daemon = True
+            self._timeout_timer.start()
+    
+    def _check_timeout(self) -> None:
+        """Deallocate the model if idle long enough, otherwise re-arm the timer."""
+        with self._lock:
+            if self._timeout_timer is threading.current_thread():
+                self._timeout_timer = None
+            
+            if not self._running or self._model is None:
+                return
             
-            if not self._running:
-                break
+            idle_time = time.monotonic() - self._last_used_time
             
-            with self._lock:
-                if self._model is not None:
-                    idle_time = time.time() - self._last_used_time
-                    
-                    if idle_time >= self.timeout_seconds:
-                        logger.info(
-                            f"Model idle for {idle_time/60:.1f} minutes, "
-                            f"deallocating..."
-                        )
-                        self._deallocate_model()
+            if idle_time >= self.timeout_seconds:
+                logger.info(
+                    f"Model idle for {idle_time/60:.1f} minutes, "
+                    f"deallocating..."
+                )
+                self._deallocate_model()
+            else:
+                self._schedule_timeout_check(self.timeout_seconds - idle_time)
     
     def is_loaded(self) -> bool:
         """Check if the model is currently loaded.
@@ -1,9 +1,15 @@
 """Core transcription functionality."""
+import hashlib
 import logging
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
+import numpy as np
+
+from .cache_manager import CacheManager
 from .model_manager import ModelManager
 
 
@@ -13,23 +19,38 @@ logger = logging.getLogger(__name__)
 class TranscriptionEngine:
     """Handles audio transcription using the ASR model."""
     
-    def __init__(self, model_manager: ModelManager):
+    def __init__(
+        self,
+        model_manager: ModelManager,
+        cache_size: int = 1024,
+        result_cache: Optional[CacheManager] = None
+    ):
         """Initialize the transcription engine.
         
         Args:
             model_manager: The model manager instance
+            cache_size: Maximum number of transcriptions kept in the in-memory
+                LRU cache keyed by audio content (0 disables caching)
+            result_cache: Optional persistent cache consulted on in-memory misses
         """
         self.model_manager = model_manager
-        logger.info("TranscriptionEngine initialized")
+        self.cache_size = cache_size
+        self.result_cache = result_cache
+        self._cache: OrderedDict[bytes, tuple[str, Optional[float]]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        logger.info(
+            f"TranscriptionEngine initialized: cache_size={cache_size}, "
+            f"persistent_cache={result_cache is not None}"
+        )
     
-    def transcribe(
+    def transcribe_array(
         self,
-        audio_file_path: Path
+        audio: np.ndarray
     ) -> tuple[str, float, Optional[float]]:
-        """Transcribe an audio file.
+        """Transcribe decoded audio samples without going through a file.
         
         Args:
-            audio_file_path: Path to the audio file
+            audio: Mono float32 samples at the model's sample rate
             
         Returns:
             Tuple of (transcription_text, processing_time_ms, confidence)
@@ -37,53 +58,215 @@ class TranscriptionEngine:
         Raises:
             RuntimeError: If transcription fails
         """
+        return self.transcribe_arrays([audio])[0]
+    
+    def transcribe_arrays(
+        self,
+        audios: list[np.ndarray]
+    ) -> list[tuple[str, float, Optional[float]]]:
+        """Transcribe several decoded clips, running all cache misses in one model call.
+        
+        Args:
+            audios: Mono float32 sample arrays at the model's sample rate
+            
+        Returns:
+            List of (transcription_text, processing_time_ms, confidence) tuples,
+            in input order; processing_time_ms covers the whole model call
+            
+        Raises:
+            RuntimeError: If transcription fails
+        """
+        start_time = time.time()
+        caching = self.cache_size > 0 or self.result_cache is not None
+        keys = [self._cache_key(audio) for audio in audios] if caching else []
+        
+        results: list[Optional[tuple[str, float, Optional[float]]]] = [None] * len(audios)
+        misses = []
+        
+        for index, audio in enumerate(audios):
+            cached = self._get_cached(keys[index]) if caching else None
+            if cached is None:
+                misses.append(index)
+                continue
+            
+            text, confidence = cached
+            results[index] = (text, (time.time() - start_time) * 1000, confidence)
+            logger.info("Transcription cache hit: length=%d chars", len(text))
+        
+        if misses:
+            logger.debug("Transcribing %d audio arrays", len(misses))
+            transcribed = self._transcribe_many(
+                [audios[index] for index in misses], batch_size=len(misses)
+            )
+            processing_time_ms = (time.time() - start_time) * 1000
+            
+            for index, (text, confidence) in zip(misses, transcribed):
+                results[index] = (text, processing_time_ms, confidence)
+                if caching:
+                    self._remember(keys[index], text, confidence)
+                    if self.result_cache is not None:
+                        self.result_cache.put(keys[index], text, confidence)
+        
+        return results
+    
+    def _get_cached(self, key: bytes) -> Optional[tuple[str, Optional[float]]]:
+        """Look up a transcription in the in-memory, then persistent cache.
+        
+        Args:
+            key: Audio cache key
+            
+        Returns:
+            Tuple of (transcription_text, confidence), or None on a miss
+        """
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+        
+        if self.result_cache is None:
+            return None
+        
+        cached = self.result_cache.get(key)
+        if cached is not None:
+            self._remember(key, *cached)
+        return cached
+    
+    def _remember(self, key: bytes, text: str, confidence: Optional[float]) -> None:
+        """Store a transcription in the in-memory LRU cache.
+        
+        Args:
+            key: Audio cache key
+            text: Transcription text
+            confidence: Transcription confidence, if available
+        """
+        if self.cache_size <= 0:
+            return
+        
+        with self._cache_lock:
+            self._cache[key] = (text, confidence)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
+    def _cache_key(self, audio: np.ndarray) -> bytes:
+        """Compute the cache key for decoded audio samples.
+        
+        The model name and compute dtype are included so persisted entries
+        are not reused after switching models or inference precision.
+        
+        Args:
+            audio: Audio samples
+            
+        Returns:
+            Digest of the model name and dtype and the sample dtype, shape
+            and contents
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(
+            f"{self.model_manager.model_name}|{self.model_manager.dtype}|"
+            f"{audio.dtype.str}{audio.shape}".encode()
+        )
+        digest.update(np.ascontiguousarray(audio).data)
+        return digest.digest()
+    
+    def transcribe_batch(
+        self,
+        audio_file_paths: list[Path],
+        batch_size: int = 16,
+        num_workers: int = 0
+    ) -> list[tuple[str, Optional[float]]]:
+        """Transcribe multiple audio files with a single model call.
+        
+        Args:
+            audio_file_paths: Paths to the audio files
+            batch_size: Number of files the model processes per forward pass
+            num_workers: Dataloader worker processes decoding audio while the
+                model runs (0 decodes in the calling process)
+            
+        Returns:
+            List of (transcription_text, confidence) tuples, in input order
+            
+        Raises:
+            RuntimeError: If transcription fails
+        """
+        logger.debug("Transcribing batch of %d audio files", len(audio_file_paths))
+        return self._transcribe_many(
+            [str(path) for path in audio_file_paths],
+            batch_size=batch_size,
+            num_workers=num_workers
+        )
+    
+    def _transcribe_many(
+        self,
+        audios: list[Union[str, np.ndarray]],
+        batch_size: int,
+        num_workers: int = 0
+    ) -> list[tuple[str, Optional[float]]]:
+        """Run the model once over several audio file paths or sample arrays.
+        
+        Args:
+            audios: Audio file paths or mono float32 sample arrays
+            batch_size: Number of inputs the model processes per forward pass
+            num_workers: Dataloader worker processes decoding audio files
+            
+        Returns:
+            List of (transcription_text, confidence) tuples, in input order
+            
+        Raises:
+            RuntimeError: If transcription fails
+        """
+        if not audios:
+            return []
+        
         start_time = time.time()
         
         try:
-            # Get the model (lazy loads if needed)
             model = self.model_manager.get_model()
             
-            logger.debug(f"Transcribing audio file: {audio_file_path}")
-            
-            # Perform transcription
-            # NeMo's transcribe method returns a list of results
-            results = model.transcribe([str(audio_file_path)])
-            
-            # Extract text from results
-            if not results or len(results) == 0:
-                raise RuntimeError("Transcription returned empty results")
-            
-            # Results can be in different formats depending on the model
-            # Handle both list of strings and list of Hypothesis objects
-            result = results[0]
-            
-            if hasattr(result, 'text'):
-                # Hypothesis object
-                text = result.text
-                confidence = getattr(result, 'score', None)
-            elif isinstance(result, str):
-                # Direct string result
-                text = result
-                confidence = None
-            else:
-                # Try to get text attribute or convert to string
-                text = str(result)
-                confidence = None
+            with self.model_manager.inference_context():
+                results = model.transcribe(audios, batch_size=batch_size, num_workers=num_workers)
+            
+            if not results or len(results) != len(audios):
+                raise RuntimeError(
+                    f"Transcription returned {len(results) if results else 0} results "
+                    f"for {len(audios)} inputs"
+                )
             
             processing_time_ms = (time.time() - start_time) * 1000
             
             logger.info(
-                f"Transcription complete: length={len(text)} chars, "
-                f"time={processing_time_ms:.2f}ms"
+                "Batch transcription complete: inputs=%d, time=%.2fms",
+                len(audios), processing_time_ms
             )
-            logger.debug(f"Transcription result: {text[:100]}...")
             
-            return text, processing_time_ms, confidence
+            return [self._extract_result(result) for result in results]
             
         except Exception as e:
             processing_time_ms = (time.time() - start_time) * 1000
             logger.error(
-                f"Transcription failed after {processing_time_ms:.2f}ms: {e}",
+                f"Batch transcription failed after {processing_time_ms:.2f}ms: {e}",
                 exc_info=True
             )
             raise RuntimeError(f"Transcription failed: {e}") from e
+    
+    @staticmethod
+    def _extract_result(result) -> tuple[str, Optional[float]]:
+        """Extract text and confidence from a single model result.
+        
+        Results can be in different formats depending on the model, so both
+        plain strings and Hypothesis objects are handled.
+        
+        Args:
+            result: A single entry from the model's transcribe() output
+            
+        Returns:
+            Tuple of (transcription_text, confidence)
+        """
+        if hasattr(result, 'text'):
+            return result.text, getattr(result, 'score', None)
+        
+        if isinstance(result, str):
+            return result, None
+        
+        return str(result), None
@@ -1,11 +1,14 @@
 """Dataset generation for TTS training."""
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Set
+from typing import Optional, Set
 from textwrap import dedent
 
 import click
 
+from ..config import STTConfig
 from ..connection.sqlite_connection import SQLiteConnection
 from ..core.model_manager import ModelManager
 from ..core.transcription import TranscriptionEngine
@@ -13,29 +16,47 @@ from ..core.transcription import TranscriptionEngine
 
 logger = logging.getLogger(__name__)
 
+# Characters that would break the "file_id|transcription" line format
+METADATA_TRANSLATION = str.maketrans({"|": " ", "\n": " ", "\r": " "})
+
 
 class DatasetGenerator:
     """Generate TTS training datasets from audio files."""
     
-    def __init__(self, wav_directory: Path, voice_actor_identifier: str):
+    def __init__(
+        self,
+        wav_directory: Path,
+        voice_actor_identifier: str,
+        batch_size: int = 16,
+        num_workers: int = 0,
+        prefetch_workers: int = 8
+    ):
         """Initialize dataset generator.
         
         Args:
             wav_directory: Directory containing .wav files
             voice_actor_identifier: Identifier for the voice actor
+            batch_size: Number of files transcribed per model call
+            num_workers: Dataloader workers decoding audio during inference
+            prefetch_workers: Threads reading the next batch from disk during inference
         """
         self.wav_directory = wav_directory
         self.voice_actor_identifier = voice_actor_identifier
+        self.batch_size = batch_size
+        self.num_workers = num_workers
+        self.prefetch_workers = prefetch_workers
         self.metadata_file = wav_directory / f"{voice_actor_identifier}.metadata.txt"
         self.db_file = wav_directory / f"{voice_actor_identifier}.metadata.db"
+        self.db = SQLiteConnection(self.db_file, persistent=True)
         
         # Initialize transcription components
-        self.model_manager = ModelManager()
+        self.model_manager = ModelManager(model_name=STTConfig.model_name)
         self.transcription_engine = TranscriptionEngine(self.model_manager)
     
     def _init_database(self):
         """Initialize the SQLite database with required table."""
-        with SQLiteConnection(self.db_file) as conn:
+        with self.db as conn:
+            conn.enable_wal()
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS transcriptions (
                     file_id TEXT PRIMARY KEY,
@@ -46,16 +67,28 @@ class DatasetGenerator:
             """)
             logger.info(f"Database initialized at {self.db_file}")
     
-    def _get_transcribed_files(self) -> dict[str, tuple[str, str]]:
-        """Get all transcribed files from the database.
+    def _get_transcribed_ids(self) -> Set[str]:
+        """Get the IDs of all transcribed files from the database.
+        
+        Returns:
+            Set of transcribed file IDs
+        """
+        with self.db as conn:
+            conn.execute("SELECT file_id FROM transcriptions")
+            return {row['file_id'] for row in conn.fetchall()}
+    
+    def _list_wav_files(self) -> dict[str, str]:
+        """List .wav files in the directory without building Path objects.
         
         Returns:
-            Dict mapping file_id to (wav_file, transcription)
+            Dict mapping file_id (filename without extension) to filename
         """
-        with SQLiteConnection(self.db_file) as conn:
-            conn.execute("SELECT file_id, wav_file, transcription FROM transcriptions")
-            rows = conn.fetchall()
-            return {row['file_id']: (row['wav_file'], row['transcription']) for row in rows}
+        with os.scandir(self.wav_directory) as entries:
+            return {
+                entry.name[:-len(".wav")]: entry.name
+                for entry in entries
+                if entry.name.endswith(".wav") and entry.is_file()
+            }
     
     def _get_metadata_file_ids(self) -> Set[str]:
         """Get all file IDs from the metadata file.
@@ -63,16 +96,16 @@ class DatasetGenerator:
         Returns:
             Set of file IDs present in metadata file
         """
-        if not self.metadata_file.exists():
-            return set()
-        
         file_ids = set()
-        with open(self.metadata_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line and '|' in line:
-                    file_id = line.split('|', 1)[0]
-                    file_ids.add(file_id)
+        try:
+            with open(self.metadata_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if line and '|' in line:
+                        file_id = line.split('|', 1)[0]
+                        file_ids.add(file_id)
+        except FileNotFoundError:
+            pass
         
         return file_ids
     
@@ -80,7 +113,7 @@ class DatasetGenerator:
         """Remove database entries not present in metadata file."""
         metadata_ids = self._get_metadata_file_ids()
         
-        with SQLiteConnection(self.db_file) as conn:
+        with self.db as conn:
             conn.execute("SELECT file_id FROM transcriptions")
             db_ids = {row['file_id'] for row in conn.fetchall()}
             
@@ -88,38 +121,159 @@ class DatasetGenerator:
             
             if orphaned_ids:
                 logger.info(f"Removing {len(orphaned_ids)} orphaned database entries")
-                placeholders = ','.join('?' * len(orphaned_ids))
-                conn.execute(
-                    f"DELETE FROM transcriptions WHERE file_id IN ({placeholders})",
-                    tuple(orphaned_ids)
+                conn.executemany(
+                    "DELETE FROM transcriptions WHERE file_id = ?",
+                    ((file_id,) for file_id in orphaned_ids)
                 )
     
-    def _save_transcription(self, file_id: str, wav_file: str, transcription: str):
-        """Save transcription to database and metadata file.
+    def _save_transcriptions(
+        self,
+        file_ids: list[str],
+        wav_paths: list[str],
+        transcriptions: list[str],
+        metadata_fd: int
+    ):
+        """Save a batch of transcriptions to the database and metadata file.
+        
+        The columns are passed as parallel lists. All rows are written in a
+        single transaction and the metadata lines in a single unbuffered
+        append, so they reach the file together with the commit. The
+        database keeps the text as transcribed; only the metadata line is
+        sanitized so it stays one "file_id|transcription" record.
         
         Args:
-            file_id: File identifier (filename without extension)
-            wav_file: Path to the wav file
-            transcription: Transcription text
+            file_ids: File IDs (filenames without extension)
+            wav_paths: Wav file paths, parallel to file_ids
+            transcriptions: Transcription texts, parallel to file_ids
+            metadata_fd: Metadata file descriptor opened with O_APPEND
         """
+        if not file_ids:
+            return
+        
         # Save to database
-        with SQLiteConnection(self.db_file) as conn:
-            conn.execute(
-                "INSERT OR REPLACE INTO transcriptions (file_id, wav_file, transcription) VALUES (?, ?, ?)",
-                (file_id, wav_file, transcription)
+        with self.db as conn:
+            conn.executemany(
+                """
+                INSERT INTO transcriptions (file_id, wav_file, transcription) VALUES (?, ?, ?)
+                ON CONFLICT(file_id) DO UPDATE SET
+                    wav_file = excluded.wav_file,
+                    transcription = excluded.transcription
+                """,
+                zip(file_ids, wav_paths, transcriptions)
             )
         
         # Append to metadata file
-        with open(self.metadata_file, 'a', encoding='utf-8') as f:
-            f.write(f"{file_id}|{transcription}\n")
+        data = memoryview("".join(
+            f"{file_id}|{transcription.translate(METADATA_TRANSLATION).strip()}\n"
+            for file_id, transcription in zip(file_ids, transcriptions)
+        ).encode("utf-8"))
+        while data:
+            data = data[os.write(metadata_fd, data):]
+    
+    def _transcribe_batch(self, wav_files: list[Path], metadata_fd: int) -> int:
+        """Transcribe a batch of wav files and save the results.
+        
+        If the batched model call fails, each file is retried on its own so
+        one unreadable file does not drop the rest of its batch.
+        
+        Args:
+            wav_files: Wav files to transcribe in a single model call
+            metadata_fd: Metadata file descriptor opened with O_APPEND
+            
+        Returns:
+            Number of files successfully transcribed
+        """
+        try:
+            results = self.transcription_engine.transcribe_batch(
+                wav_files, batch_size=self.batch_size, num_workers=self.num_workers
+            )
+        except Exception as e:
+            if len(wav_files) == 1:
+                self._report_failure(wav_files[0], e)
+                return 0
+            
+            logger.warning(
+                "Failed to transcribe batch starting at %s, retrying each file on its own: %s",
+                wav_files[0], e
+            )
+            wav_files, results = self._transcribe_each(wav_files)
+        
+        file_ids = [wav_file.stem for wav_file in wav_files]
+        wav_paths = [str(wav_file) for wav_file in wav_files]
+        transcriptions = [transcription for transcription, _ in results]
+        
+        if logger.isEnabledFor(logging.INFO):
+            for file_id, transcription in zip(file_ids, transcriptions):
+                logger.info(f"Transcribed {file_id}: {len(transcription)} chars")
+        
+        self._save_transcriptions(file_ids, wav_paths, transcriptions, metadata_fd)
+        
+        return len(file_ids)
+    
+    def _transcribe_each(
+        self,
+        wav_files: list[Path]
+    ) -> tuple[list[Path], list[tuple[str, Optional[float]]]]:
+        """Transcribe wav files one model call at a time, skipping failures.
+        
+        Args:
+            wav_files: Wav files to transcribe
+            
+        Returns:
+            Tuple of (transcribed_files, results) for the files that succeeded
+        """
+        transcribed = []
+        results = []
+        
+        for wav_file in wav_files:
+            try:
+                results.extend(self.transcription_engine.transcribe_batch(
+                    [wav_file], batch_size=1, num_workers=self.num_workers
+                ))
+            except Exception as e:
+                self._report_failure(wav_file, e)
+                continue
+            
+            transcribed.append(wav_file)
+        
+        return transcribed, results
+    
+    @staticmethod
+    def _report_failure(wav_file: Path, error: Exception) -> None:
+        """Report a wav file that could not be transcribed.
+        
+        Args:
+            wav_file: The wav file
+            error: The transcription failure
+        """
+        click.echo(f"\nError transcribing {wav_file.name}: {error}", err=True)
+        logger.error(f"Failed to transcribe {wav_file}: {error}", exc_info=True)
+    
+    @staticmethod
+    def _prefetch(prefetcher: ThreadPoolExecutor, wav_files: list[Path]) -> None:
+        """Read wav files in the background so the model finds them in the page cache.
+        
+        Args:
+            prefetcher: Executor running the reads
+            wav_files: Wav files to read ahead
+        """
+        for wav_file in wav_files:
+            prefetcher.submit(wav_file.read_bytes)
     
     def generate(self):
         """Generate the dataset by transcribing all .wav files."""
+        try:
+            self._generate()
+        finally:
+            self.db.close()
+    
+    def _generate(self):
+        """Transcribe pending .wav files and print a summary."""
         # Initialize database
         self._init_database()
         
-        # Get list of all .wav files
-        wav_files = list(self.wav_directory.glob("*.wav"))
+        # Get all .wav files keyed by file ID
+        wav_files = self._list_wav_files()
         
         if not wav_files:
             click.echo(f"No .wav files found in {self.wav_directory}")
@@ -127,50 +281,36 @@ class DatasetGenerator:
         
         click.echo(f"Found {len(wav_files)} .wav files in {self.wav_directory}")
         
-        # Get already transcribed files
-        transcribed = self._get_transcribed_files()
-        
-        # Create metadata file if it doesn't exist
-        if not self.metadata_file.exists():
-            self.metadata_file.touch()
-        
-        # Clean up orphaned database entries
+        # Clean up orphaned database entries before deciding what to skip
         self._cleanup_orphaned_entries()
         
-        # Process each wav file
+        # Only files not yet in the database need transcribing
+        pending_ids = wav_files.keys() - self._get_transcribed_ids()
+        pending = [self.wav_directory / wav_files[file_id] for file_id in sorted(pending_ids)]
+        skipped = len(wav_files) - len(pending)
+        
+        # Process pending files in batches, reading each next batch during inference
+        batches = [
+            pending[batch_start:batch_start + self.batch_size]
+            for batch_start in range(0, len(pending), self.batch_size)
+        ]
         processed = 0
-        skipped = 0
-        
-        with click.progressbar(
-            wav_files,
-            label="Transcribing audio files",
-            show_pos=True
-        ) as files:
-            for wav_file in files:
-                file_id = wav_file.stem  # Filename without extension
-                
-                # Skip if already transcribed
-                if file_id in transcribed:
-                    skipped += 1
-                    logger.debug(f"Skipping already transcribed file: {file_id}")
-                    continue
-                
-                try:
-                    # Transcribe the audio file
-                    transcription, processing_time_ms, _ = self.transcription_engine.transcribe(wav_file)
-                    
-                    # Save the transcription
-                    self._save_transcription(file_id, str(wav_file), transcription)
-                    
-                    processed += 1
-                    logger.info(
-                        f"Transcribed {file_id}: {len(transcription)} chars "
-                        f"in {processing_time_ms:.2f}ms"
-                    )
-                    
-                except Exception as e:
-                    click.echo(f"\nError transcribing {wav_file.name}: {e}", err=True)
-                    logger.error(f"Failed to transcribe {wav_file}: {e}", exc_info=True)
+        # O_CREAT creates the metadata file on the first run
+        metadata_fd = os.open(self.metadata_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=self.prefetch_workers) as prefetcher, click.progressbar(
+                length=len(pending),
+                label="Transcribing audio files",
+                show_pos=True
+            ) as progress:
+                for index, batch in enumerate(batches):
+                    if index + 1 < len(batches):
+                        self._prefetch(prefetcher, batches[index + 1])
+                    processed += self._transcribe_batch(batch, metadata_fd)
+                    progress.update(len(batch))
+        finally:
+            os.close(metadata_fd)
         
         # Summary
         click.echo(dedent(f"""
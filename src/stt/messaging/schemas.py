@@ -3,6 +3,9 @@ from dataclasses import dataclass
 from typing import Literal, Optional
 
 
+_AUDIO_FORMATS = frozenset({"wav", "flac"})
+
+
 @dataclass
 class AudioRequest:
     """Request message containing audio data for transcription."""
@@ -18,19 +21,32 @@ class AudioRequest:
         Returns:
             Tuple of (is_valid, error_message)
         """
+        if (
+            self.request_id
+            and self.audio_format in _AUDIO_FORMATS
+            and self.sample_rate > 0
+            and self.audio_data
+        ):
+            return True, None
+        
+        return False, self._validation_error()
+    
+    def _validation_error(self) -> str:
+        """Describe the first failing check; only called for invalid requests.
+        
+        Returns:
+            Error message
+        """
         if not self.request_id:
-            return False, "request_id cannot be empty"
+            return "request_id cannot be empty"
         
-        if self.audio_format not in ["wav", "flac"]:
-            return False, f"Invalid audio format: {self.audio_format}. Must be 'wav' or 'flac'"
+        if self.audio_format not in _AUDIO_FORMATS:
+            return f"Invalid audio format: {self.audio_format}. Must be 'wav' or 'flac'"
         
         if self.sample_rate <= 0:
-            return False, f"Invalid sample rate: {self.sample_rate}"
-        
-        if not self.audio_data:
-            return False, "audio_data cannot be empty"
+            return f"Invalid sample rate: {self.sample_rate}"
         
-        return True, None
+        return "audio_data cannot be empty"
 
 
 @dataclass
@@ -1,4 +1,6 @@
 """Serialization utilities for msgpack encoding/decoding of message schemas."""
+from typing import Union
+
 import msgpack
 
 from .schemas import AudioRequest, TranscriptionResponse
@@ -13,20 +15,37 @@ def serialize_audio_request(request: AudioRequest) -> bytes:
     Returns:
         Msgpack-encoded bytes
     """
-    data = {
-        "request_id": request.request_id,
-        "audio_format": request.audio_format,
-        "sample_rate": request.sample_rate,
-        "audio_data": request.audio_data,
-    }
-    return msgpack.packb(data, use_bin_type=True)
+    return msgpack.packb(request.__dict__, use_bin_type=True)
+
+
+def serialize_audio_request_view(request: AudioRequest) -> memoryview:
+    """Serialize an AudioRequest to msgpack without copying the encoded message.
+    
+    The packer's buffer is returned as-is instead of being copied into a
+    new bytes object, which matters for multi-megabyte audio payloads.
+    Each call uses its own packer, so the view stays valid after further
+    calls and can be sent with zmq's copy=False.
+    
+    Args:
+        request: The AudioRequest to serialize
+        
+    Returns:
+        Read-only view over the msgpack-encoded message
+    """
+    packer = msgpack.Packer(
+        use_bin_type=True,
+        autoreset=False,
+        buf_size=len(request.audio_data) + 256
+    )
+    packer.pack(request.__dict__)
+    return packer.getbuffer()
 
 
-def deserialize_audio_request(data: bytes) -> AudioRequest:
+def deserialize_audio_request(data: Union[bytes, memoryview]) -> AudioRequest:
     """Deserialize msgpack bytes to an AudioRequest.
     
     Args:
-        data: Msgpack-encoded bytes
+        data: Msgpack-encoded bytes or a buffer view over them
         
     Returns:
         Deserialized AudioRequest object
@@ -42,7 +61,7 @@ def deserialize_audio_request(data: bytes) -> AudioRequest:
             sample_rate=obj["sample_rate"],
             audio_data=obj["audio_data"],
         )
-    except (KeyError, msgpack.exceptions.UnpackException) as e:
+    except (KeyError, TypeError, ValueError, msgpack.exceptions.UnpackException) as e:
         raise ValueError(f"Failed to deserialize AudioRequest: {e}") from e
 
 
@@ -55,22 +74,14 @@ def serialize_transcription_response(response: TranscriptionResponse) -> bytes:
     Returns:
         Msgpack-encoded bytes
     """
-    data = {
-        "request_id": response.request_id,
-        "status": response.status,
-        "text": response.text,
-        "confidence": response.confidence,
-        "processing_time_ms": response.processing_time_ms,
-        "error_details": response.error_details,
-    }
-    return msgpack.packb(data, use_bin_type=True)
+    return msgpack.packb(response.__dict__, use_bin_type=True)
 
 
-def deserialize_transcription_response(data: bytes) -> TranscriptionResponse:
+def deserialize_transcription_response(data: Union[bytes, memoryview]) -> TranscriptionResponse:
     """Deserialize msgpack bytes to a TranscriptionResponse.
     
     Args:
-        data: Msgpack-encoded bytes
+        data: Msgpack-encoded bytes or a buffer view over them (e.g. zmq.Frame.buffer)
         
     Returns:
         Deserialized TranscriptionResponse object
@@ -88,5 +99,5 @@ def deserialize_transcription_response(data: bytes) -> TranscriptionResponse:
             processing_time_ms=obj.get("processing_time_ms", 0.0),
             error_details=obj.get("error_details"),
         )
-    except (KeyError, msgpack.exceptions.UnpackException) as e:
+    except (KeyError, TypeError, ValueError, msgpack.exceptions.UnpackException) as e:
         raise ValueError(f"Failed to deserialize TranscriptionResponse: {e}") from e
@@ -1,5 +1,6 @@
-"""ZMQ socket handler for ROUTER (input) and DEALER (output) communication."""
+"""ZMQ socket handler for ROUTER (input) and PUSH (output) communication."""
 import logging
+import os
 import zmq
 from typing import Optional, Tuple
 
@@ -10,22 +11,49 @@ from .serialization import deserialize_audio_request, serialize_transcription_re
 logger = logging.getLogger(__name__)
 
 
+def configure_socket(socket: zmq.Socket, hwm: int, buffer_bytes: int) -> None:
+    """Apply throughput-related options to a socket before bind/connect.
+    
+    Args:
+        socket: The ZMQ socket to configure
+        hwm: Send and receive high water mark (queued messages)
+        buffer_bytes: Kernel send and receive buffer size in bytes
+    """
+    socket.setsockopt(zmq.RCVHWM, hwm)
+    socket.setsockopt(zmq.SNDHWM, hwm)
+    socket.setsockopt(zmq.RCVBUF, buffer_bytes)
+    socket.setsockopt(zmq.SNDBUF, buffer_bytes)
+    socket.setsockopt(zmq.TCP_KEEPALIVE, 1)
+
+
 class ZMQHandler:
-    """Manages ZMQ ROUTER (input) and DEALER (output) sockets."""
+    """Manages ZMQ ROUTER (input) and PUSH (output) sockets."""
     
-    def __init__(self, input_address: str, output_address: str):
+    def __init__(
+        self,
+        input_address: str,
+        output_address: str,
+        hwm: int = 10000,
+        buffer_bytes: int = 4 * 1024 * 1024
+    ):
         """Initialize ZMQ handler.
         
         Args:
             input_address: Address to bind ROUTER socket (e.g., tcp://*:5555)
-            output_address: Address to connect DEALER socket (e.g., tcp://localhost:5556)
+            output_address: Address to connect PUSH socket (e.g., tcp://localhost:5556)
+            hwm: Socket high water mark (queued messages)
+            buffer_bytes: Kernel socket buffer size in bytes
         """
         self.input_address = input_address
         self.output_address = output_address
+        self.hwm = hwm
+        self.buffer_bytes = buffer_bytes
         
         self.context: Optional[zmq.Context] = None
         self.input_socket: Optional[zmq.Socket] = None
         self.output_socket: Optional[zmq.Socket] = None
+        self._poller: Optional[zmq.Poller] = None
+        self._wakeup_fd: Optional[int] = None
         
         logger.info(f"ZMQHandler initialized with input={input_address}, output={output_address}")
     
@@ -37,13 +65,33 @@ class ZMQHandler:
         
         # ROUTER socket for receiving requests (acts as server)
         self.input_socket = self.context.socket(zmq.ROUTER)
+        configure_socket(self.input_socket, self.hwm, self.buffer_bytes)
         self.input_socket.bind(self.input_address)
         logger.info(f"ROUTER socket bound to {self.input_address}")
         
-        # DEALER socket for sending responses (acts as client)
-        self.output_socket = self.context.socket(zmq.DEALER)
+        self._poller = zmq.Poller()
+        self._poller.register(self.input_socket, zmq.POLLIN)
+        
+        # PUSH socket for sending responses (acts as client)
+        self.output_socket = self.context.socket(zmq.PUSH)
+        configure_socket(self.output_socket, self.hwm, self.buffer_bytes)
         self.output_socket.connect(self.output_address)
-        logger.info(f"DEALER socket connected to {self.output_address}")
+        logger.info(f"PUSH socket connected to {self.output_address}")
+    
+    def set_wakeup_fd(self, fd: int) -> None:
+        """Make receive_request return early when fd becomes readable.
+        
+        Intended for the read end of a signal.set_wakeup_fd() pipe, so a
+        shutdown signal interrupts the poll instead of waiting for its timeout.
+        
+        Args:
+            fd: Non-blocking file descriptor to watch alongside the input socket
+        """
+        if not self._poller:
+            raise RuntimeError("Poller not initialized. Call setup() first.")
+        
+        self._wakeup_fd = fd
+        self._poller.register(fd, zmq.POLLIN)
     
     def receive_request(self, timeout_ms: int = 100) -> Optional[Tuple[bytes, AudioRequest]]:
         """Receive an audio request from the input socket.
@@ -61,44 +109,41 @@ class ZMQHandler:
             raise RuntimeError("Input socket not initialized. Call setup() first.")
         
         # Poll with timeout to avoid blocking indefinitely
-        poller = zmq.Poller()
-        poller.register(self.input_socket, zmq.POLLIN)
+        events = dict(self._poller.poll(timeout_ms))
         
-        events = dict(poller.poll(timeout_ms))
+        if self._wakeup_fd in events:
+            os.read(self._wakeup_fd, 4096)
         
         if self.input_socket not in events:
             return None
         
         try:
             # ROUTER receives: [identity, empty, data]
-            print("Waiting...")
-            message_parts = self.input_socket.recv_multipart()
-            #print(f"Message parts: {message_parts}")
-            print("received...")
+            message_parts = self.input_socket.recv_multipart(copy=False)
             
             if len(message_parts) < 2:
-                print("Err, wrong message format length, expected two parts")
                 logger.error(f"Invalid message format: expected at least 2 parts, got {len(message_parts)}")
                 return None
             
-            identity = message_parts[0]
-            print(f"identitiy: {identity}")
+            identity = message_parts[0].bytes
             # message_parts[1] is the delimiter (empty frame)
-            request_data = message_parts[-1] if len(message_parts) > 1 else message_parts[0]
-            print("request data fetched")
+            request_data = message_parts[-1].buffer
             
             # Deserialize the request
             request = deserialize_audio_request(request_data)
-            print("deserialized")
             
-            logger.debug(f"Received request {request.request_id} from client {identity.hex()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Received %d-part request %s from client %s",
+                    len(message_parts), request.request_id, identity.hex()
+                )
             return identity, request
             
-        except ValueError as e:
-            logger.error(f"Failed to deserialize request: {e}")
+        except ValueError:
+            # Malformed client input; the caller logs it once
             raise
         except Exception as e:
-            logger.error(f"Unexpected error receiving request: {e}", exc_info=True)
+            logger.error("Unexpected error receiving request: %s", e, exc_info=True)
             return None
     
     def send_response(self, response: TranscriptionResponse) -> None:
@@ -111,14 +156,16 @@ class ZMQHandler:
             raise RuntimeError("Output socket not initialized. Call setup() first.")
         
         try:
-            # Serialize the response
-            response_data = serialize_transcription_response(response)
-            
-            # DEALER sends without identity frame
-            self.output_socket.send(response_data)
+            # PUSH sends a single frame with no envelope; pyzmq still copies
+            # payloads below its copy threshold, where that is cheaper
+            self.output_socket.send(serialize_transcription_response(response), copy=False)
             
-            logger.debug(f"Sent response for request {response.request_id} (status={response.status})")
-            logger.debug(f"Transcribed text: {response.text}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Sent response for request %s (status=%s)",
+                    response.request_id, response.status
+                )
+                logger.debug("Transcribed text: %s", response.text)
             
         except Exception as e:
             logger.error(f"Failed to send response for request {response.request_id}: {e}", exc_info=True)
@@ -128,6 +175,13 @@ class ZMQHandler:
         """Clean up ZMQ sockets and context."""
         logger.info("Cleaning up ZMQ resources...")
         
+        if self._poller and self.input_socket:
+            self._poller.unregister(self.input_socket)
+        if self._poller and self._wakeup_fd is not None:
+            self._poller.unregister(self._wakeup_fd)
+        self._poller = None
+        self._wakeup_fd = None
+        
         if self.input_socket:
             self.input_socket.close()
             self.input_socket = None
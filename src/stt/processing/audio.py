@@ -1,7 +1,8 @@
 """Audio processing and validation utilities."""
+import io
 import logging
-import tempfile
-from pathlib import Path
+import struct
+import threading
 from typing import Tuple, Optional
 
 import soundfile as sf
@@ -10,9 +11,19 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+WAVE_FORMAT_PCM = 1
+PCM16_SCALE = np.float32(1.0 / 32768.0)
+# Longest stereo clip decoded into the reused per-thread buffer (30s at 16kHz)
+STEREO_BUFFER_MAX_FRAMES = 30 * 16000
+
 
 class AudioProcessor:
-    """Handles audio validation and optional mono conversion."""
+    """Handles audio validation and optional mono conversion.
+    
+    A single instance can be shared by several decode threads: its only
+    mutable state is thread-local, and libsndfile decoding and NumPy
+    downmixing release the GIL, so the threads decode in parallel.
+    """
     
     def __init__(self, expected_sample_rate: int = 16000, convert_to_mono: bool = False):
         """Initialize the audio processor.
@@ -23,6 +34,7 @@ class AudioProcessor:
         """
         self.expected_sample_rate = expected_sample_rate
         self.convert_to_mono = convert_to_mono
+        self._local = threading.local()
         
         logger.info(
             f"AudioProcessor initialized: sample_rate={expected_sample_rate}Hz, "
@@ -30,10 +42,10 @@ class AudioProcessor:
         )
     
     def validate_and_process(
-        self, 
-        audio_data: bytes, 
+        self,
+        audio_data: bytes,
         audio_format: str
-    ) -> Tuple[bool, Optional[str], Optional[Path]]:
+    ) -> Tuple[bool, Optional[str], Optional[np.ndarray]]:
         """Validate audio data and optionally convert to mono.
         
         Args:
@@ -41,34 +53,48 @@ class AudioProcessor:
             audio_format: Audio format ('wav' or 'flac')
             
         Returns:
-            Tuple of (is_valid, error_message, temp_file_path)
+            Tuple of (is_valid, error_message, audio)
             - is_valid: Whether the audio passed validation
             - error_message: Error description if validation failed
-            - temp_file_path: Path to temporary audio file (caller should clean up)
+            - audio: Decoded mono float32 samples if validation passed
         """
         try:
-            # Write audio data to temporary file
-            temp_path = self._write_temp_file(audio_data, audio_format)
+            # Headers are validated before any samples are decoded, so
+            # rejected requests never pay for decoding
+            wav_layout = self._parse_pcm16_wav(audio_data) if audio_format == "wav" else None
             
-            try:
-                # Load and validate audio
-                data, sample_rate = self._load_and_validate_audio(temp_path, audio_format)
-                
-                # Validate sample rate
-                is_valid, error_msg = self._validate_sample_rate(sample_rate)
+            if wav_layout is not None:
+                sample_rate, channels, data_offset, data_size = wav_layout
+                is_valid, error_msg = self._validate_header(sample_rate, channels)
                 if not is_valid:
-                    temp_path.unlink()
                     return False, error_msg, None
                 
-                # Handle stereo audio if needed
-                return self._handle_stereo_audio(data, sample_rate, temp_path, audio_format)
-                
-            except Exception as e:
-                # Clean up temp file on error
-                if temp_path.exists():
-                    temp_path.unlink()
-                raise
-                
+                data = self._decode_pcm16(audio_data, channels, data_offset, data_size)
+            else:
+                with sf.SoundFile(io.BytesIO(audio_data)) as audio_file:
+                    sample_rate, channels = audio_file.samplerate, audio_file.channels
+                    is_valid, error_msg = self._validate_header(sample_rate, channels)
+                    if not is_valid:
+                        return False, error_msg, None
+                    
+                    data = self._decode_audio(audio_file)
+            
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "AUDIO FILE ANALYSIS - Bytes: %d, Sample Rate: %dHz, Channels: %d, "
+                    "Samples: %d, Duration: %.2fs, Shape: %s, Format: %s",
+                    len(audio_data),
+                    sample_rate,
+                    channels,
+                    len(data),
+                    len(data) / sample_rate if sample_rate > 0 else 0,
+                    data.shape,
+                    audio_format
+                )
+            
+            # Handle stereo audio if needed
+            return True, None, self._handle_stereo_audio(data)
+        
         except sf.LibsndfileError as e:
             error_msg = f"Failed to read audio file: {e}"
             logger.error(error_msg)
@@ -78,55 +104,129 @@ class AudioProcessor:
             logger.error(error_msg, exc_info=True)
             return False, error_msg, None
     
-    def _write_temp_file(self, audio_data: bytes, audio_format: str) -> Path:
-        """Write audio data to a temporary file.
+    @staticmethod
+    def _parse_pcm16_wav(audio_data: bytes) -> Optional[Tuple[int, int, int, int]]:
+        """Locate the samples of a 16-bit PCM WAV file by walking its RIFF chunks.
         
         Args:
             audio_data: Raw audio bytes
-            audio_format: Audio format extension
             
         Returns:
-            Path to the temporary file
+            Tuple of (sample_rate, channels, data_offset, data_size), or None
+            if the bytes are not plain 16-bit PCM WAV and need libsndfile
         """
-        temp_file = tempfile.NamedTemporaryFile(
-            suffix=f".{audio_format}",
-            delete=False
-        )
-        temp_path = Path(temp_file.name)
-        temp_file.write(audio_data)
-        temp_file.close()
-        return temp_path
+        if len(audio_data) < 12 or audio_data[0:4] != b"RIFF" or audio_data[8:12] != b"WAVE":
+            return None
+        
+        fmt = None
+        offset = 12
+        while offset + 8 <= len(audio_data):
+            chunk_id, chunk_size = struct.unpack_from("<4sI", audio_data, offset)
+            body = offset + 8
+            
+            if chunk_id == b"fmt " and chunk_size >= 16 and body + 16 <= len(audio_data):
+                fmt = struct.unpack_from("<HHIIHH", audio_data, body)
+            elif chunk_id == b"data":
+                if fmt is None:
+                    return None
+                
+                format_tag, channels, sample_rate, _, block_align, bits_per_sample = fmt
+                if format_tag != WAVE_FORMAT_PCM or bits_per_sample != 16 or channels < 1:
+                    return None
+                if block_align != 2 * channels:
+                    return None
+                
+                data_size = min(chunk_size, len(audio_data) - body)
+                return sample_rate, channels, body, data_size - data_size % block_align
+            
+            # Chunks are padded to an even size
+            offset = body + chunk_size + (chunk_size & 1)
+        
+        return None
     
-    def _load_and_validate_audio(
-        self, 
-        temp_path: Path, 
-        audio_format: str
-    ) -> Tuple[np.ndarray, int]:
-        """Load audio file and return data and sample rate.
+    def _decode_pcm16(
+        self,
+        audio_data: bytes,
+        channels: int,
+        data_offset: int,
+        data_size: int
+    ) -> np.ndarray:
+        """Convert 16-bit PCM samples to float32 with one vectorized multiply.
         
         Args:
-            temp_path: Path to the temporary audio file
-            audio_format: Audio format for logging
+            audio_data: Raw audio bytes
+            channels: Number of interleaved channels
+            data_offset: Byte offset of the first sample
+            data_size: Size of the sample data in bytes
             
         Returns:
-            Tuple of (audio_data, sample_rate)
+            Decoded audio samples, shaped like libsndfile's output
         """
-        data, sample_rate = sf.read(str(temp_path))
+        pcm = np.frombuffer(audio_data, dtype="<i2", count=data_size // 2, offset=data_offset)
         
-        duration_seconds = len(data) / sample_rate if sample_rate > 0 else 0
-        num_channels = data.shape[1] if len(data.shape) > 1 else 1
+        if channels == 1:
+            return np.multiply(pcm, PCM16_SCALE, dtype=np.float32)
         
-        logger.info(
-            f"AUDIO FILE ANALYSIS - Path: {temp_path}, "
-            f"Sample Rate: {sample_rate}Hz, "
-            f"Channels: {num_channels}, "
-            f"Samples: {len(data)}, "
-            f"Duration: {duration_seconds:.2f}s, "
-            f"Shape: {data.shape}, "
-            f"Format: {audio_format}"
-        )
+        frames = pcm.reshape(-1, channels)
+        if channels == 2:
+            return np.multiply(frames, PCM16_SCALE, out=self._stereo_buffer(len(frames)))
+        return np.multiply(frames, PCM16_SCALE, dtype=np.float32)
+    
+    def _decode_audio(self, audio_file: sf.SoundFile) -> np.ndarray:
+        """Decode an opened in-memory audio file to float32 samples.
+        
+        Stereo audio never leaves the processor (it is downmixed or rejected),
+        so it is decoded into a per-thread buffer reused across requests
+        (see _stereo_buffer).
+        Other audio is returned to the caller and gets a fresh array.
+        
+        Args:
+            audio_file: Audio file opened over the request bytes
+            
+        Returns:
+            Decoded audio samples
+        """
+        if audio_file.channels == 2:
+            return audio_file.read(dtype="float32", out=self._stereo_buffer(audio_file.frames))
+        return audio_file.read(dtype="float32")
+    
+    def _stereo_buffer(self, frames: int) -> np.ndarray:
+        """Get this thread's stereo decode buffer, growing it if needed.
+        
+        The buffer never grows past STEREO_BUFFER_MAX_FRAMES, so one long
+        clip does not pin its memory in the thread; longer clips get a
+        fresh array instead.
+        
+        Args:
+            frames: Number of frames required
+            
+        Returns:
+            Float32 array of shape (frames, 2)
+        """
+        if frames > STEREO_BUFFER_MAX_FRAMES:
+            return np.empty((frames, 2), dtype=np.float32)
+        
+        buffer = getattr(self._local, "stereo_buffer", None)
+        if buffer is None or len(buffer) < frames:
+            buffer = np.empty((frames, 2), dtype=np.float32)
+            self._local.stereo_buffer = buffer
+        return buffer[:frames]
+    
+    def _validate_header(self, sample_rate: int, channels: int) -> Tuple[bool, Optional[str]]:
+        """Validate the sample rate and channel count read from the header.
+        
+        Args:
+            sample_rate: The actual sample rate
+            channels: Number of audio channels
+            
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        is_valid, error_msg = self._validate_sample_rate(sample_rate)
+        if not is_valid:
+            return is_valid, error_msg
         
-        return data, sample_rate
+        return self._validate_channels(channels)
     
     def _validate_sample_rate(self, sample_rate: int) -> Tuple[bool, Optional[str]]:
         """Validate that the sample rate matches expected value.
@@ -147,89 +247,56 @@ class AudioProcessor:
         
         return True, None
     
-    def _handle_stereo_audio(
-        self, 
-        data: np.ndarray, 
-        sample_rate: int,
-        temp_path: Path,
-        audio_format: str
-    ) -> Tuple[bool, Optional[str], Optional[Path]]:
-        """Handle stereo audio - either reject or convert to mono.
+    def _validate_channels(self, channels: int) -> Tuple[bool, Optional[str]]:
+        """Reject multi-channel audio unless mono conversion is enabled.
         
         Args:
-            data: Audio data array
-            sample_rate: Sample rate in Hz
-            temp_path: Path to the original temporary file
-            audio_format: Audio format extension
+            channels: Number of audio channels
             
         Returns:
-            Tuple of (is_valid, error_message, temp_file_path)
+            Tuple of (is_valid, error_message)
         """
-        is_stereo = len(data.shape) == 2 and data.shape[1] == 2
-        
-        if not is_stereo:
-            # Audio is already mono
-            logger.debug("Audio is mono, no conversion needed")
-            return True, None, temp_path
-        
-        if not self.convert_to_mono:
+        if channels > 1 and not self.convert_to_mono:
             error_msg = (
-                "Audio is stereo but mono conversion is disabled. "
+                f"Audio has {channels} channels but mono conversion is disabled. "
                 "Expected mono audio (1 channel)."
             )
             logger.warning(error_msg)
-            temp_path.unlink()
-            return False, error_msg, None
-        
-        # Convert stereo to mono
-        mono_path = self._convert_to_mono(data, sample_rate, audio_format)
-        temp_path.unlink()  # Clean up original stereo file
+            return False, error_msg
         
-        return True, None, mono_path
+        return True, None
     
-    def _convert_to_mono(
-        self, 
-        stereo_data: np.ndarray, 
-        sample_rate: int,
-        audio_format: str
-    ) -> Path:
-        """Convert stereo audio to mono and write to new temp file.
+    def _handle_stereo_audio(self, data: np.ndarray) -> np.ndarray:
+        """Convert stereo or other multi-channel audio to mono.
         
         Args:
-            stereo_data: Stereo audio data array
-            sample_rate: Sample rate in Hz
-            audio_format: Audio format extension
+            data: Audio data array
             
         Returns:
-            Path to the mono audio temporary file
+            Audio data array without the channel axis
         """
-        logger.info("Converting stereo audio to mono")
-        mono_data = np.mean(stereo_data, axis=1)
-        
-        # Create new temp file for mono audio
-        mono_temp = tempfile.NamedTemporaryFile(
-            suffix=f"_mono.{audio_format}",
-            delete=False
-        )
-        mono_path = Path(mono_temp.name)
-        mono_temp.close()
-        
-        # Write mono audio
-        sf.write(str(mono_path), mono_data, sample_rate)
+        if data.ndim != 2:
+            # Audio is already mono
+            logger.debug("Audio is mono, no conversion needed")
+            return data
         
-        logger.debug(f"Mono conversion complete: {mono_path}")
-        return mono_path
+        return self._convert_to_mono(data)
     
-    @staticmethod
-    def cleanup_temp_file(file_path: Optional[Path]) -> None:
-        """Clean up a temporary file.
+    def _convert_to_mono(self, stereo_data: np.ndarray) -> np.ndarray:
+        """Convert stereo or other multi-channel audio to mono.
         
         Args:
-            file_path: Path to the temporary file to delete
+            stereo_data: Audio data array of shape (frames, channels)
+            
+        Returns:
+            Mono float32 audio data array
         """
-        if file_path and file_path.exists():
-            try:
-                file_path.unlink()
-                logger.debug(f"Cleaned up temp file: {file_path}")
-            except Exception as e:
-                logger.warning(f"Failed to clean up temp file {file_path}: {e}")
+        logger.info("Converting %d-channel audio to mono", stereo_data.shape[1])
+        # Summing whole channel columns is an elementwise SIMD loop; reducing
+        # along the short channel axis runs a tiny reduction per frame instead
+        num_channels = stereo_data.shape[1]
+        mono_data = np.add(stereo_data[:, 0], stereo_data[:, 1], dtype=np.float32)
+        for channel in range(2, num_channels):
+            mono_data += stereo_data[:, channel]
+        mono_data *= np.float32(1.0 / num_channels)
+        return mono_data
@@ -1,9 +1,16 @@
 """Main STT service orchestration and event loop."""
 import logging
+import os
+import queue
 import signal
-from typing import Optional
+import threading
+import time
+from typing import Callable, Optional
+
+import numpy as np
 
 from .config import STTConfig
+from .core.cache_manager import CacheManager
 from .core.model_manager import ModelManager
 from .core.transcription import TranscriptionEngine
 from .messaging.schemas import TranscriptionResponse
@@ -14,6 +21,11 @@ from .utils.logging import PeriodicFlusher
 
 logger = logging.getLogger(__name__)
 
+_STOP = object()
+
+# The receive poll is woken by signals, so this only bounds idle wakeups
+RECEIVE_TIMEOUT_MS = 1000
+
 
 class STTService:
     """Main service that orchestrates all components."""
@@ -29,11 +41,21 @@ class STTService:
         
         self.model_manager = ModelManager(
             model_name=config.model_name,
-            timeout_minutes=config.model_timeout_minutes
+            timeout_minutes=config.model_timeout_minutes,
+            dtype=config.model_dtype
         )
         
+        self.result_cache = None
+        if config.result_cache_db is not None:
+            self.result_cache = CacheManager(
+                db_path=config.result_cache_db,
+                max_entries=config.result_cache_max_entries
+            )
+        
         self.transcription_engine = TranscriptionEngine(
-            model_manager=self.model_manager
+            model_manager=self.model_manager,
+            cache_size=config.transcription_cache_size,
+            result_cache=self.result_cache
         )
         
         self.audio_processor = AudioProcessor(
@@ -43,11 +65,22 @@ class STTService:
         
         self.zmq_handler = ZMQHandler(
             input_address=config.input_address,
-            output_address=config.output_address
+            output_address=config.output_address,
+            hwm=config.zmq_hwm,
+            buffer_bytes=config.zmq_buffer_bytes
         )
         
         self.log_flusher = PeriodicFlusher(interval_seconds=3600)
         
+        # receive -> decode workers -> inference -> sender, each stage bounded
+        self._request_queue: queue.Queue = queue.Queue(maxsize=config.pipeline_queue_size)
+        self._audio_queue: queue.Queue = queue.Queue(maxsize=config.pipeline_queue_size)
+        self._response_queue: queue.Queue = queue.Queue(maxsize=config.pipeline_queue_size)
+        self._decode_threads: list[threading.Thread] = []
+        self._inference_thread: Optional[threading.Thread] = None
+        self._sender_thread: Optional[threading.Thread] = None
+        self._wakeup_fds: Optional[tuple[int, int]] = None
+        
         logger.info("STTService initialized")
     
     def setup(self) -> None:
@@ -55,72 +88,174 @@ class STTService:
         logger.info("Setting up STT service...")
         
         self.zmq_handler.setup()
+        if self.result_cache is not None:
+            self.result_cache.open()
         self.model_manager.start_monitoring()
+        self.model_manager.warmup(sample_rate=self.config.expected_sample_rate)
         self.log_flusher.start()
+        self._start_pipeline()
         
         logger.info("STT service setup complete")
     
     def run(self) -> None:
         """Run the main service loop."""
-        self.setup()
-        
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
-        
-        self.running = True
-        logger.info("STT service started, waiting for requests...")
-        
         try:
-            while self.running:
-                self._process_one_request()
-        except Exception as e:
-            logger.error(f"Fatal error in service loop: {e}", exc_info=True)
+            self.setup()
+            self._install_signal_handlers()
+            
+            self.running = True
+            logger.info("STT service started, waiting for requests...")
+            
+            try:
+                while self.running:
+                    self._process_one_request()
+            except Exception as e:
+                logger.error(f"Fatal error in service loop: {e}", exc_info=True)
         finally:
             self.cleanup()
     
     def _process_one_request(self) -> None:
-        """Process a single request from the input queue."""
-        temp_file: Optional[any] = None
-        
+        """Receive a single request and hand it to the decode workers."""
         try:
-            result = self.zmq_handler.receive_request(timeout_ms=100)
+            result = self.zmq_handler.receive_request(timeout_ms=RECEIVE_TIMEOUT_MS)
             
             if result is None:
                 return
             
             identity, request = result
-            logger.info(f"Processing request {request.request_id}")
-            
-            is_valid, error_msg = request.validate()
-            if not is_valid:
-                self._send_error_response(request, "Request validation failed", error_msg)
-                return
-            
-            is_valid, error_msg, temp_file = self.audio_processor.validate_and_process(
-                audio_data=request.audio_data,
-                audio_format=request.audio_format
-            )
-            
-            if not is_valid:
-                self._send_error_response(request, "Audio validation failed", error_msg)
-                return
-            
-            self.zmq_handler.send_response(self._try_transcribe_audio(temp_file, request))
+            self._request_queue.put(request)
             
         except ValueError as e:
-            logger.error(f"Failed to deserialize request: {e}")
+            logger.error("Failed to deserialize request: %s", e)
             
         except Exception as e:
-            logger.error(f"Unexpected error processing request: {e}", exc_info=True)
+            logger.error("Unexpected error receiving request: %s", e, exc_info=True)
+    
+    def _start_pipeline(self) -> None:
+        """Start the decode, inference and sender threads."""
+        self._decode_threads = [
+            self._start_thread(self._decode_loop, f"stt-decode-{i}")
+            for i in range(self.config.decode_workers)
+        ]
+        self._inference_thread = self._start_thread(self._inference_loop, "stt-inference")
+        self._sender_thread = self._start_thread(self._sender_loop, "stt-sender")
+        logger.info(f"Pipeline started with {self.config.decode_workers} decode workers")
+    
+    @staticmethod
+    def _start_thread(target: Callable[[], None], name: str) -> threading.Thread:
+        """Start a daemon thread running target.
+        
+        Args:
+            target: Function to run in the thread
+            name: Thread name
             
-        finally:
-            # TESTING: Persist temp files for debugging audio issues
-            if temp_file is not None:
-                logger.info(f"TESTING: Audio file persisted at: {temp_file}")
-                # AudioProcessor.cleanup_temp_file(temp_file)
-
+        Returns:
+            The started thread
+        """
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        thread.start()
+        return thread
+    
+    def _stop_pipeline(self) -> None:
+        """Drain and stop the pipeline threads, upstream stages first."""
+        for _ in self._decode_threads:
+            self._request_queue.put(_STOP)
+        for thread in self._decode_threads:
+            thread.join()
+        self._decode_threads = []
+        
+        if self._inference_thread is not None:
+            self._audio_queue.put(_STOP)
+            self._inference_thread.join()
+            self._inference_thread = None
+        
+        if self._sender_thread is not None:
+            self._response_queue.put(_STOP)
+            self._sender_thread.join()
+            self._sender_thread = None
+    
+    def _decode_loop(self) -> None:
+        """Validate and decode requests; soundfile releases the GIL while decoding."""
+        while (request := self._request_queue.get()) is not _STOP:
+            try:
+                logger.info("Processing request %s", request.request_id)
+                
+                is_valid, error_msg = request.validate()
+                if not is_valid:
+                    self._send_error_response(request, "Request validation failed", error_msg)
+                    continue
+                
+                is_valid, error_msg, audio = self.audio_processor.validate_and_process(
+                    audio_data=request.audio_data,
+                    audio_format=request.audio_format
+                )
+                
+                if not is_valid:
+                    self._send_error_response(request, "Audio validation failed", error_msg)
+                    continue
+                
+                if audio.ndim != 1 or audio.size == 0:
+                    self._send_error_response(
+                        request,
+                        "Audio validation failed",
+                        f"Expected non-empty mono audio, got samples of shape {audio.shape}"
+                    )
+                    continue
+                
+                self._audio_queue.put((request, audio))
+                
+            except Exception as e:
+                logger.error(f"Unexpected error processing request: {e}", exc_info=True)
+    
+    def _inference_loop(self) -> None:
+        """Transcribe decoded audio in micro-batches on the model's device."""
+        while (batch := self._next_batch()) is not None:
+            for response in self._try_transcribe_batch(batch):
+                self._response_queue.put(response)
+    
+    def _next_batch(self) -> Optional[list[tuple]]:
+        """Collect decoded requests until the batch is full or its window closes.
+        
+        Blocks for the first request, then waits at most batch_window_ms for
+        more, so a lone request is only delayed by the window.
+        
+        Returns:
+            List of (request, audio) tuples, or None once the pipeline stops
+        """
+        item = self._audio_queue.get()
+        if item is _STOP:
+            return None
+        
+        batch = [item]
+        deadline = time.monotonic() + self.config.batch_window_ms / 1000
+        
+        while len(batch) < self.config.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._audio_queue.get(timeout=max(remaining, 0))
+            except queue.Empty:
+                break
+            
+            if item is _STOP:
+                # Finish this batch; the next call sees the sentinel and stops
+                self._audio_queue.put(_STOP)
+                break
+            
+            batch.append(item)
+        
+        return batch
+    
+    def _sender_loop(self) -> None:
+        """Send responses; this is the only thread that uses the output socket."""
+        while (response := self._response_queue.get()) is not _STOP:
+            try:
+                self.zmq_handler.send_response(response)
+            except Exception:
+                # send_response has already logged the failure
+                continue
+    
     def _send_error_response(self, request, error_type: str, error_detail: str) -> None:
-        """Send an error response to the client.
+        """Queue an error response for the client.
         
         Args:
             request: The transcription request
@@ -132,7 +267,25 @@ class STTService:
             request_id=request.request_id,
             error_message=f"{error_type}: {error_detail}"
         )
-        self.zmq_handler.send_response(response)
+        self._response_queue.put(response)
+    
+    def _install_signal_handlers(self) -> None:
+        """Install shutdown handlers that also wake the receive poll.
+        
+        Python writes a byte to the wakeup pipe when a signal arrives, and the
+        pipe's read end is polled alongside the input socket, so shutdown does
+        not wait for the poll timeout. Must be called from the main thread.
+        """
+        signal.signal(signal.SIGINT, self._signal_handler)
+        signal.signal(signal.SIGTERM, self._signal_handler)
+        
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        self._wakeup_fds = (read_fd, write_fd)
+        
+        signal.set_wakeup_fd(write_fd)
+        self.zmq_handler.set_wakeup_fd(read_fd)
     
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals.
@@ -149,49 +302,116 @@ class STTService:
         logger.info("Cleaning up STT service...")
         
         try:
+            self._stop_pipeline()
             self.model_manager.stop_monitoring()
             self.log_flusher.stop()
             self.zmq_handler.cleanup()
+            if self.result_cache is not None:
+                self.result_cache.close()
+            
+            if self._wakeup_fds is not None:
+                signal.set_wakeup_fd(-1)
+                for fd in self._wakeup_fds:
+                    os.close(fd)
+                self._wakeup_fds = None
             
         except Exception as e:
             logger.error(f"Error during cleanup: {e}", exc_info=True)
         
         logger.info("STT service cleanup complete")
-
-
-    def _try_transcribe_audio(self, temp_file, request) -> TranscriptionResponse:
-        """Attempt to transcribe audio and create appropriate response.
+    
+    def _try_transcribe_batch(self, batch: list[tuple]) -> list[TranscriptionResponse]:
+        """Attempt to transcribe a batch of requests and create their responses.
+        
+        If the batched model call fails, each request is retried on its own
+        so that only the requests that actually fail get error responses.
         
         Args:
-            temp_file: Path to temporary audio file
-            request: The transcription request
+            batch: List of (request, audio) tuples with decoded mono audio
             
         Returns:
-            TranscriptionResponse with success or error details
+            TranscriptionResponse per request, with success or error details
         """
         try:
-            text, processing_time_ms, confidence = self.transcription_engine.transcribe(
-                audio_file_path=temp_file
+            results = self.transcription_engine.transcribe_arrays(
+                [audio for _, audio in batch]
             )
             
-            logger.info(
-                f"Request {request.request_id} completed successfully in "
-                f"{processing_time_ms:.2f}ms"
-            )
+        except Exception as e:
+            if len(batch) == 1:
+                request, _ = batch[0]
+                return [self._transcription_error(request, e)]
             
-            return TranscriptionResponse.create_success(
-                request_id=request.request_id,
-                text=text,
-                processing_time_ms=processing_time_ms,
-                confidence=confidence
+            logger.warning(
+                "Transcription failed for batch of %d requests, retrying each on its own: %s",
+                len(batch), e
             )
+            return [self._try_transcribe_audio(request, audio) for request, audio in batch]
+        
+        return [
+            self._transcription_success(request, *result)
+            for (request, _), result in zip(batch, results)
+        ]
+    
+    def _try_transcribe_audio(self, request, audio: np.ndarray) -> TranscriptionResponse:
+        """Attempt to transcribe a single request and create its response.
+        
+        Args:
+            request: The transcription request
+            audio: Decoded mono audio samples
             
+        Returns:
+            TranscriptionResponse with success or error details
+        """
+        try:
+            result = self.transcription_engine.transcribe_array(audio)
         except Exception as e:
-            logger.error(
-                f"Transcription failed for request {request.request_id}: {e}",
-                exc_info=True
-            )
-            return TranscriptionResponse.create_error(
-                request_id=request.request_id,
-                error_message=f"Transcription failed: {str(e)}"
-            )
+            return self._transcription_error(request, e)
+        
+        return self._transcription_success(request, *result)
+    
+    @staticmethod
+    def _transcription_success(
+        request,
+        text: str,
+        processing_time_ms: float,
+        confidence: Optional[float]
+    ) -> TranscriptionResponse:
+        """Create the success response for a transcribed request.
+        
+        Args:
+            request: The transcription request
+            text: Transcription text
+            processing_time_ms: Time spent transcribing
+            confidence: Transcription confidence, if available
+            
+        Returns:
+            Success TranscriptionResponse
+        """
+        logger.info(
+            "Request %s completed successfully in %.2fms",
+            request.request_id, processing_time_ms
+        )
+        return TranscriptionResponse.create_success(
+            request_id=request.request_id,
+            text=text,
+            processing_time_ms=processing_time_ms,
+            confidence=confidence
+        )
+    
+    @staticmethod
+    def _transcription_error(request, error: Exception) -> TranscriptionResponse:
+        """Create the error response for a request whose transcription failed.
+        
+        Args:
+            request: The transcription request
+            error: The transcription failure
+            
+        Returns:
+            Error TranscriptionResponse
+        """
+        logger.error("Transcription failed for request %s: %s", request.request_id, error)
+        return TranscriptionResponse.create_error(
+            request_id=request.request_id,
+            error_message=f"Transcription failed: {str(error)}"
+        )
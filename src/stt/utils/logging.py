@@ -3,12 +3,15 @@ import logging
 import logging.handlers
 from pathlib import Path
 from typing import Optional
-import time
 import threading
 
 
 class TimedAndSizeRotatingFileHandler(logging.handlers.RotatingFileHandler):
-    """File handler that rotates based on both size and time."""
+    """Size-based rotating file handler configured in bytes and backup days.
+    
+    Periodic flushing is left to PeriodicFlusher, so emitting a record does
+    not read the clock.
+    """
     
     def __init__(
         self,
@@ -31,32 +34,44 @@ class TimedAndSizeRotatingFileHandler(logging.handlers.RotatingFileHandler):
             backupCount=backup_days,
             encoding=encoding,
         )
-        self.last_check_time = time.time()
-        self.check_interval = 3600  # Check every hour
-        
-    def shouldRollover(self, record: logging.LogRecord) -> int:
-        """Determine if rollover should occur.
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders each second's timestamp only once.
+    
+    The date format has second resolution, so every record within the same
+    second shares the strftime result instead of recomputing it.
+    """
+    
+    def __init__(self, fmt: Optional[str], datefmt: str):
+        """Initialize the formatter.
         
-        Checks both file size and time since last check.
+        Args:
+            fmt: Record format string
+            datefmt: strftime format for %(asctime)s, with second resolution.
+                Required because the default format adds milliseconds, which
+                would go stale in the cache.
+        """
+        super().__init__(fmt=fmt, datefmt=datefmt)
+        # A single tuple so concurrent handlers never see a mismatched pair
+        self._cached_time: tuple[int, str] = (-1, "")
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Return the record's timestamp, reusing the last one within a second.
         
         Args:
             record: The log record
+            datefmt: strftime format
             
         Returns:
-            1 if rollover should occur, 0 otherwise
+            Formatted timestamp
         """
-        # Check size-based rollover (from parent class)
-        if super().shouldRollover(record):
-            return 1
-        
-        # Check time-based rollover
-        current_time = time.time()
-        if current_time - self.last_check_time >= self.check_interval:
-            self.last_check_time = current_time
-            # Force a flush every hour
-            self.flush()
-        
-        return 0
+        second = int(record.created)
+        cached_second, cached_text = self._cached_time
+        if second != cached_second:
+            cached_text = super().formatTime(record, datefmt)
+            self._cached_time = (second, cached_text)
+        return cached_text
 
 
 def setup_logging(
@@ -77,7 +92,7 @@ def setup_logging(
     log_file.parent.mkdir(parents=True, exist_ok=True)
     
     # Create formatter
-    formatter = logging.Formatter(
+    formatter = CachedTimeFormatter(
         fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S"
     )
@@ -126,6 +141,7 @@ class PeriodicFlusher:
         self.interval = interval_seconds
         self.running = False
         self.thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
         
     def start(self) -> None:
         """Start the flusher thread."""
@@ -133,6 +149,7 @@ class PeriodicFlusher:
             return
         
         self.running = True
+        self._stop_event.clear()
         self.thread = threading.Thread(target=self._flush_loop, daemon=True)
         self.thread.start()
         logging.debug("Periodic log flusher started")
@@ -140,16 +157,16 @@ class PeriodicFlusher:
     def stop(self) -> None:
         """Stop the flusher thread."""
         self.running = False
+        self._stop_event.set()
         if self.thread:
             self.thread.join(timeout=2.0)
         logging.debug("Periodic log flusher stopped")
     
     def _flush_loop(self) -> None:
         """Background loop that flushes handlers periodically."""
-        while self.running:
-            time.sleep(self.interval)
-            if self.running:
-                self._flush_all_handlers()
+        # wait() returns True as soon as stop() sets the event
+        while not self._stop_event.wait(self.interval):
+            self._flush_all_handlers()
     
     def _flush_all_handlers(self) -> None:
         """Flush all handlers in the root logger."""
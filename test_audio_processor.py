@@ -0,0 +1,104 @@
+"""Tests for the AudioProcessor WAV fast path against libsndfile."""
+import io
+import struct
+from typing import Optional
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from src.stt.processing.audio import AudioProcessor
+
+
+SAMPLE_RATE = 16000
+FRAMES = 1601
+
+
+def _chunk(chunk_id: bytes, body: bytes) -> bytes:
+    """Build a RIFF chunk, padding odd-sized bodies to an even length."""
+    return struct.pack("<4sI", chunk_id, len(body)) + body + b"\0" * (len(body) & 1)
+
+
+def _fmt(channels: int, block_align: Optional[int] = None) -> bytes:
+    """Build a 16-bit PCM fmt chunk."""
+    if block_align is None:
+        block_align = 2 * channels
+    return _chunk(b"fmt ", struct.pack(
+        "<HHIIHH", 1, channels, SAMPLE_RATE, SAMPLE_RATE * block_align, block_align, 16
+    ))
+
+
+def _wav(*chunks: bytes) -> bytes:
+    """Wrap chunks in a RIFF/WAVE header."""
+    body = b"WAVE" + b"".join(chunks)
+    return struct.pack("<4sI", b"RIFF", len(body)) + body
+
+
+def _pcm(channels: int) -> bytes:
+    """Deterministic interleaved 16-bit samples covering the full range."""
+    rng = np.random.default_rng(channels)
+    return rng.integers(-32768, 32768, size=FRAMES * channels, dtype="<i2").tobytes()
+
+
+def _expected(audio_data: bytes) -> np.ndarray:
+    """Decode with libsndfile and downmix the way the processor does."""
+    data, _ = sf.read(io.BytesIO(audio_data), dtype="float32")
+    return data if data.ndim == 1 else data.mean(axis=1, dtype=np.float32)
+
+
+CASES = [
+    pytest.param(_wav(_fmt(1), _chunk(b"data", _pcm(1))), id="mono"),
+    pytest.param(_wav(_fmt(2), _chunk(b"data", _pcm(2))), id="stereo"),
+    pytest.param(
+        _wav(_fmt(1), _chunk(b"LIST", b"INFOISFT\x05\0\0\0test\0\0"), _chunk(b"data", _pcm(1))),
+        id="list-chunk"
+    ),
+    pytest.param(_wav(_fmt(1), _chunk(b"junk", b"odd"), _chunk(b"data", _pcm(1))), id="odd-chunk"),
+    pytest.param(
+        _wav(_fmt(1), struct.pack("<4sI", b"data", 4 * FRAMES) + _pcm(1)),
+        id="truncated-data"
+    ),
+]
+
+
+@pytest.mark.parametrize("audio_data", CASES)
+def test_pcm16_matches_libsndfile(audio_data: bytes):
+    """The fast path decodes plain PCM16 WAV exactly like libsndfile."""
+    assert AudioProcessor._parse_pcm16_wav(audio_data) is not None
+    
+    is_valid, error_msg, audio = AudioProcessor(convert_to_mono=True).validate_and_process(
+        audio_data, "wav"
+    )
+    
+    assert is_valid, error_msg
+    np.testing.assert_allclose(audio, _expected(audio_data), rtol=0, atol=1e-7)
+
+
+@pytest.mark.parametrize("audio_data", [
+    pytest.param(_wav(_fmt(0, block_align=0), _chunk(b"data", _pcm(1))), id="zero-channels"),
+    pytest.param(_wav(_chunk(b"fmt ", b"\1\0\1\0"), _chunk(b"data", _pcm(1))), id="short-fmt"),
+    pytest.param(_wav(_chunk(b"data", _pcm(1))), id="missing-fmt"),
+])
+def test_malformed_fmt_is_rejected(audio_data: bytes):
+    """Malformed headers skip the fast path and fail validation without raising."""
+    assert AudioProcessor._parse_pcm16_wav(audio_data) is None
+    
+    with pytest.raises(sf.LibsndfileError):
+        sf.read(io.BytesIO(audio_data))
+    
+    is_valid, error_msg, audio = AudioProcessor().validate_and_process(audio_data, "wav")
+    
+    assert not is_valid
+    assert error_msg.startswith("Failed to read audio file")
+    assert audio is None
+
+
+def test_inconsistent_block_align_falls_back_to_libsndfile():
+    """Headers the fast path does not trust are decoded by libsndfile instead."""
+    audio_data = _wav(_fmt(1, block_align=4), _chunk(b"data", _pcm(1)))
+    assert AudioProcessor._parse_pcm16_wav(audio_data) is None
+    
+    is_valid, error_msg, audio = AudioProcessor().validate_and_process(audio_data, "wav")
+    
+    assert is_valid, error_msg
+    np.testing.assert_array_equal(audio, _expected(audio_data))
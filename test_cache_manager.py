@@ -0,0 +1,73 @@
+"""Tests for the persistent transcription result cache."""
+import itertools
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.stt.core import cache_manager
+from src.stt.core.cache_manager import CacheManager
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "cache.db"
+
+
+@pytest.fixture
+def cache(db_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Open cache whose clock ticks once per call, so LRU order is deterministic."""
+    clock = itertools.count()
+    monkeypatch.setattr(cache_manager, "time", SimpleNamespace(time=lambda: next(clock)))
+    manager = CacheManager(db_path, max_entries=10)
+    manager.open()
+    yield manager
+    manager.close()
+
+
+def test_put_and_get(cache: CacheManager):
+    """Stored transcriptions are returned; unknown keys miss."""
+    cache.put(b"a", "hello", 0.5)
+    
+    assert cache.get(b"a") == ("hello", 0.5)
+    assert cache.get(b"missing") is None
+
+
+def test_overwrite_does_not_grow_entry_count(cache: CacheManager):
+    """Storing an existing key replaces its text without counting a new entry."""
+    cache.put(b"a", "first", None)
+    cache.put(b"a", "second", 0.9)
+    
+    assert cache.get(b"a") == ("second", 0.9)
+    assert cache._entry_count == 1
+
+
+def test_evicts_least_recently_used(cache: CacheManager):
+    """Exceeding max_entries evicts the least recently used entries down to 90%."""
+    for index in range(10):
+        cache.put(bytes([index]), f"text {index}", None)
+    cache.get(bytes([0]))
+    
+    cache.put(b"new", "new", None)
+    
+    assert cache._entry_count == 9
+    assert cache.get(bytes([0])) == ("text 0", None)
+    assert cache.get(b"new") == ("new", None)
+    assert cache.get(bytes([1])) is None
+    assert cache.get(bytes([2])) is None
+
+
+def test_survives_restart(cache: CacheManager, db_path: Path):
+    """Entries and the entry count are restored when the database is reopened."""
+    cache.put(b"a", "hello", 0.5)
+    cache.put(b"b", "world", None)
+    cache.close()
+    
+    reopened = CacheManager(db_path, max_entries=10)
+    reopened.open()
+    try:
+        assert reopened._entry_count == 2
+        assert reopened.get(b"a") == ("hello", 0.5)
+        assert reopened.get(b"b") == ("world", None)
+    finally:
+        reopened.close()
@@ -5,7 +5,7 @@ from pathlib import Path
 
 from src.stt.messaging.schemas import AudioRequest, TranscriptionResponse
 from src.stt.messaging.serialization import (
-    serialize_audio_request,
+    serialize_audio_request_view,
     deserialize_transcription_response,
 )
 
@@ -43,8 +43,8 @@ def test_stt_service():
         print(f"Sending request: {request.request_id}")
         
         # Serialize and send
-        request_bytes = serialize_audio_request(request)
-        socket.send(request_bytes)
+        request_view = serialize_audio_request_view(request)
+        socket.send(request_view, copy=False)
         
         print("Waiting for response...")
         
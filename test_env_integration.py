@@ -1,58 +1,82 @@
 #!/usr/bin/env python3
 """Integration test demonstrating the environment variable configuration."""
+import contextlib
 import os
-from src.stt.config import STTConfig
+from typing import Optional
 
+from src.stt.config import DEFAULT_INPUT_ADDRESS, STTConfig
 
-def main():
-    print("=" * 70)
-    print("ZMQ Router Address Configuration Test")
-    print("=" * 70)
-    print()
-    
-    # Scenario 1: Default value
-    print("Scenario 1: No environment variable, no CLI override")
-    print("-" * 70)
-    os.environ.pop("STT_INPUT_ADDRESS", None)
-    config = STTConfig()
-    print(f"  Result: {config.input_address}")
-    print(f"  ✓ Using default value")
-    print()
-    
-    # Scenario 2: Environment variable
-    print("Scenario 2: STT_INPUT_ADDRESS environment variable set")
-    print("-" * 70)
-    os.environ["STT_INPUT_ADDRESS"] = "tcp://*:5555"
-    config = STTConfig()
-    print(f"  Environment: STT_INPUT_ADDRESS=tcp://*:5555")
-    print(f"  Result: {config.input_address}")
-    print(f"  ✓ Using environment variable")
-    print()
+
+ENV_ADDRESS = "tcp://*:5555"
+CLI_ADDRESS = "tcp://*:9999"
+
+
+@contextlib.contextmanager
+def _env(**overrides: Optional[str]):
+    """Temporarily set environment variables, restoring them on exit.
     
-    # Scenario 3: CLI override
-    print("Scenario 3: CLI flag overrides environment variable")
-    print("-" * 70)
-    os.environ["STT_INPUT_ADDRESS"] = "tcp://*:5555"
-    config = STTConfig(input_address="tcp://*:9999")
-    print(f"  Environment: STT_INPUT_ADDRESS=tcp://*:5555")
-    print(f"  CLI Flag: --input-address tcp://*:9999")
-    print(f"  Result: {config.input_address}")
-    print(f"  ✓ CLI override takes precedence")
-    print()
+    A value of None removes the variable for the duration of the block.
+    """
+    saved = {key: os.environ.get(key) for key in overrides}
+    try:
+        _apply_env(overrides)
+        yield
+    finally:
+        _apply_env(saved)
+
+
+def _apply_env(values: dict[str, Optional[str]]) -> None:
+    """Set each variable, removing those whose value is None."""
+    for key, value in values.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+
+
+SCENARIOS = [
+    ("No environment variable, no CLI override", None, None, DEFAULT_INPUT_ADDRESS),
+    ("STT_INPUT_ADDRESS environment variable set", ENV_ADDRESS, None, ENV_ADDRESS),
+    ("CLI flag overrides environment variable", ENV_ADDRESS, CLI_ADDRESS, CLI_ADDRESS),
+]
+
+SCENARIO_TEMPLATE = """Scenario {number}: {label}
+{rule}
+  Environment: STT_INPUT_ADDRESS={env}
+  CLI Flag: --input-address {override}
+  Result: {result}
+  ✓ Matches expected {expected}
+"""
+
+
+def main():
+    rule = "=" * 70
+    print(f"{rule}\nZMQ Router Address Configuration Test\n{rule}\n")
     
-    print("=" * 70)
-    print("Configuration Priority Order:")
-    print("=" * 70)
-    print("  1. CLI flag (--input-address)     [HIGHEST PRIORITY]")
-    print("  2. Environment variable (STT_INPUT_ADDRESS)")
-    print("  3. Default (tcp://localhost:20499) [LOWEST PRIORITY]")
-    print()
-    print("✅ Implementation complete and verified!")
-    print("=" * 70)
+    for number, (label, env, override, expected) in enumerate(SCENARIOS, start=1):
+        with _env(STT_INPUT_ADDRESS=env):
+            config = STTConfig() if override is None else STTConfig(input_address=override)
+        assert config.input_address == expected, \
+            f"Expected '{expected}', got '{config.input_address}'"
+        print(SCENARIO_TEMPLATE.format(
+            number=number,
+            label=label,
+            rule="-" * 70,
+            env=env or "(unset)",
+            override=override or "(none)",
+            result=config.input_address,
+            expected=expected
+        ))
     
-    # Clean up
-    os.environ.pop("STT_INPUT_ADDRESS", None)
+    print(f"""{rule}
+Configuration Priority Order:
+{rule}
+  1. CLI flag (--input-address)     [HIGHEST PRIORITY]
+  2. Environment variable (STT_INPUT_ADDRESS)
+  3. Default ({DEFAULT_INPUT_ADDRESS}) [LOWEST PRIORITY]
 
+✅ Implementation complete and verified!
+{rule}""")
 
 if __name__ == "__main__":
     main()